@@ -1,9 +1,12 @@
 """Main entry point for ApexEngineer"""
 
 import logging
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -16,11 +19,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from src.ai import GPT4AllClient
-from src.config import ConfigManager
+from src.ai import GPT4AllClient, LatestRequestQueue
+from src.config import AppConfig, ConfigManager
 from src.telemetry import AssettoCorsaReader, ContextEngine
 from src.voice import VoiceHandler
 
+# Console output for the query path is written by a daemon thread so stdio
+# locking/flushing never delays voice or inference; it is started by the
+# first aprint() call
+_print_q: "queue.Queue[tuple]" = queue.Queue()
+_print_thread: Optional[threading.Thread] = None
+_print_lock = threading.Lock()
+
+
+def _print_loop() -> None:
+    while True:
+        args, kwargs = _print_q.get()
+        print(*args, **kwargs)
+
+
+def aprint(*args, **kwargs) -> None:
+    """Queue a print() call for the background console thread"""
+    global _print_thread
+    if _print_thread is None:
+        with _print_lock:
+            if _print_thread is None:
+                _print_thread = threading.Thread(target=_print_loop, daemon=True, name="aprint")
+                _print_thread.start()
+    _print_q.put((args, kwargs))
+
 
 class ApexEngineer:
     """Main ApexEngineer application"""
@@ -28,11 +55,13 @@ class ApexEngineer:
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize ApexEngineer"""
         self.config = ConfigManager(config_path)
+        # Resolve every setting once; hot paths use plain attribute access
+        self.cfg = AppConfig.from_config(self.config)
 
         # Configure logging level from config
-        log_level = self.config.get("logging.level", "INFO").upper()
+        log_level = self.cfg.logging_level.upper()
         logging.getLogger().setLevel(getattr(logging, log_level, logging.INFO))
-        logger.info(f"Logging level set to: {log_level}")
+        logger.info("Logging level set to: %s", log_level)
 
         # Initialize components
         self.telemetry_reader = AssettoCorsaReader()
@@ -42,27 +71,43 @@ class ApexEngineer:
 
         # State
         self.running = False
-        self.last_telemetry_update = 0
-        self.update_rate = self.config.get("telemetry.update_rate", 10)
+        self._stop_event = threading.Event()
+        self.telemetry_thread: Optional[threading.Thread] = None
+        # Queries are answered one at a time by a single inference thread;
+        # one arriving while another waits replaces it (latest wins)
+        self._query_queue = LatestRequestQueue()
+        self.inference_thread: Optional[threading.Thread] = None
 
     def _init_ai_module(self):
         """Initialize GPT4All AI module"""
-        return GPT4AllClient(
-            model_name=self.config.get("ai.model_name", "mistral-7b-instruct-v0.1.Q4_0.gguf"),
-            model_path=self.config.get("ai.model_path"),
-            temperature=self.config.get("ai.temperature", 0.7),
-            max_tokens=self.config.get("ai.max_tokens", 150),
-            n_threads=self.config.get("ai.n_threads", 4),
-            language=self.config.get("ai.language", "es"),
+        ai_module = GPT4AllClient(
+            model_name=self.cfg.ai_model_name,
+            model_path=self.cfg.ai_model_path,
+            temperature=self.cfg.ai_temperature,
+            max_tokens=self.cfg.ai_max_tokens,
+            n_threads=self.cfg.ai_n_threads,
+            language=self.cfg.ai_language,
+            thread_sweep=self.cfg.ai_thread_sweep,
+            quantization=self.cfg.ai_quantization,
         )
 
+        # Save the sweep winner so later runs start with it directly (in the
+        # tuning file: rewriting config.yaml would drop its comments)
+        if self.cfg.ai_thread_sweep and ai_module.thread_sweep_measured:
+            self.config.set_tuning("ai.n_threads", ai_module.n_threads)
+            logger.info("Saved n_threads=%d to %s", ai_module.n_threads, self.config.tuning_path)
+
+        return ai_module
+
     def _init_voice_handler(self):
         """Initialize voice handler"""
         return VoiceHandler(
-            stt_enabled=self.config.get("voice.stt_enabled", True),
-            tts_enabled=self.config.get("voice.tts_enabled", False),
-            push_to_talk_key=self.config.get("voice.push_to_talk_key", "SPACE"),
-            microphone_index=self.config.get("voice.microphone_index"),
+            stt_enabled=self.cfg.voice_stt_enabled,
+            tts_enabled=self.cfg.voice_tts_enabled,
+            push_to_talk_key=self.cfg.voice_push_to_talk_key,
+            microphone_index=self.cfg.voice_microphone_index,
+            whisper_model=self.cfg.voice_whisper_model,
+            stt_backend=self.cfg.voice_stt_backend,
         )
 
     def start(self) -> None:
@@ -90,44 +135,76 @@ class ApexEngineer:
         else:
             logger.info("AI module is ready")
 
+        # Inference runs on its own long-lived thread, never on the voice or
+        # telemetry threads
+        self.inference_thread = threading.Thread(target=self._inference_loop, daemon=True)
+        self.inference_thread.start()
+
         # Setup voice handler
         logger.debug("Setting up voice handler...")
         self.voice_handler.on_transcription = self._handle_user_query
         self.voice_handler.start()
         logger.info("Voice handler started")
 
-        # Start main loop
+        # Poll telemetry on its own thread so context stays fresh while
+        # queries are being answered
         self.running = True
+        self.telemetry_thread = threading.Thread(target=self._telemetry_loop, daemon=True)
+        self.telemetry_thread.start()
+        logger.debug("Telemetry thread started")
+
+        # Main thread just waits for shutdown
         self._main_loop()
 
     def stop(self) -> None:
         """Stop ApexEngineer"""
         print("Stopping ApexEngineer...")
         self.running = False
+        self._stop_event.set()  # Wake the telemetry and main loops immediately
         self.voice_handler.stop()
+        self._query_queue.close()  # Let the inference thread exit
+        if self.telemetry_thread and self.telemetry_thread.is_alive():
+            self.telemetry_thread.join(timeout=1.0)
         self.telemetry_reader.disconnect()
+        self.ai_module.close()
 
     def _main_loop(self) -> None:
-        """Main application loop (optimized for low CPU usage)"""
+        """Main application loop (idle until shutdown)"""
         print("ApexEngineer is running. Press Ctrl+C to stop.")
         print("Hold SPACE (or configured key) to talk to your engineer.")
 
         try:
-            while self.running:
-                # Update telemetry at configured rate
-                current_time = time.time()
-                if current_time - self.last_telemetry_update >= 1.0 / self.update_rate:
-                    self._update_telemetry()
-                    self.last_telemetry_update = current_time
-
-                # Adaptive sleep: longer sleep when not processing queries
-                # This reduces CPU usage significantly when idle
-                time.sleep(0.05)  # Increased from 0.01 to reduce CPU usage
-
+            # Wait with a timeout so Ctrl+C is still delivered on Windows,
+            # where an untimed wait cannot be interrupted
+            while self.running and not self._stop_event.wait(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             print("\nShutting down...")
             self.stop()
 
+    def _telemetry_loop(self) -> None:
+        """Telemetry polling loop (runs in its own thread, sleeps until the next deadline)"""
+        period = 1.0 / self.cfg.telemetry_update_rate
+        next_deadline = time.monotonic()
+
+        while self.running:
+            # Sleep exactly until the next telemetry deadline; stop() sets
+            # the event so shutdown doesn't wait for the residual period
+            sleep_for = next_deadline - time.monotonic()
+            if sleep_for > 0 and self._stop_event.wait(timeout=sleep_for):
+                break
+
+            try:
+                self._update_telemetry()
+            except Exception as e:
+                logger.error("Error updating telemetry: %s", e, exc_info=True)
+            next_deadline += period
+
+            # If we fell behind (e.g. slow read), resync instead of bursting
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline = now + period
+
     def _update_telemetry(self) -> None:
         """Update telemetry data"""
         telemetry = self.telemetry_reader.read()
@@ -145,22 +222,25 @@ class ApexEngineer:
             logger.debug("Empty query received, ignoring")
             return
 
-        logger.info(f"Received query: {query}")
-        print(f"\nDriver: {query}")
+        logger.info("Received query: %s", query)
+        aprint(f"\nDriver: {query}")
 
-        # Process query in a separate thread to avoid blocking telemetry loop
-        import threading
-        processing_thread = threading.Thread(
-            target=self._process_user_query,
-            args=(query,),
-            daemon=True
-        )
-        processing_thread.start()
-        logger.debug("Query processing started in background thread")
+        # Hand off to the inference thread to avoid blocking the voice thread
+        if self._query_queue.submit(query):
+            logger.info("Dropped the pending query in favour of the newer one")
+        logger.debug("Query queued for inference")
+
+    def _inference_loop(self) -> None:
+        """Inference worker loop (answers the latest pending query)"""
+        while True:
+            query = self._query_queue.get()
+            if query is None:
+                break
+            self._process_user_query(query)
 
     def _process_user_query(self, query: str) -> None:
         """
-        Process user query with AI (runs in background thread)
+        Process user query with AI (runs in the inference thread)
 
         Args:
             query: Transcribed user query
@@ -169,29 +249,38 @@ class ApexEngineer:
             # Get current context
             logger.debug("Getting telemetry context...")
             context = self.context_engine.get_detailed_context()
-            logger.debug(f"Context retrieved: {len(context)} keys")
+            logger.debug("Context retrieved: %d keys", len(context))
+
+            # Speak each sentence as soon as it is generated so TTS overlaps
+            # with the rest of the LLM decoding
+            on_sentence = None
+            spoken = []
+            if self.voice_handler.tts_enabled:
+                language = self.cfg.ai_language
+
+                def on_sentence(sentence: str) -> None:
+                    spoken.append(sentence)
+                    self.voice_handler.speak(sentence, language=language)
 
             # Generate AI response
             logger.info("Generating AI response...")
-            print("[AI] Thinking...", end="", flush=True)
-            start_time = time.time()
+            aprint("[AI] Thinking...", end="", flush=True)
+            start_time = time.perf_counter()
             
-            response = self.ai_module.generate_response(query, context)
+            response = self.ai_module.generate_response(query, context, on_sentence=on_sentence)
             
-            elapsed = time.time() - start_time
-            logger.info(f"AI response generated in {elapsed:.2f}s")
-            print(f"\r[AI] Response ready ({elapsed:.2f}s)")  # Clear the "Thinking..." line
-            print(f"Engineer: {response}")
+            elapsed = time.perf_counter() - start_time
+            logger.info("AI response generated in %.2fs", elapsed)
+            aprint(f"\r[AI] Response ready ({elapsed:.2f}s)")  # Clear the "Thinking..." line
+            aprint(f"Engineer: {response}")
 
-            # Speak response if TTS enabled (also non-blocking via edge-tts)
-            if self.voice_handler.tts_enabled:
+            # Nothing was streamed (e.g. an error message), speak the full reply
+            if self.voice_handler.tts_enabled and not spoken:
                 logger.debug("Speaking response via TTS...")
-                language = self.config.get("ai.language", "es")
-                # TTS already runs in async context, but we can make it more explicit
                 self.voice_handler.speak(response, language=language)
         except Exception as e:
-            logger.error(f"Error processing user query: {e}", exc_info=True)
-            print(f"Error processing query: {e}")
+            logger.error("Error processing user query: %s", e, exc_info=True)
+            print(f"Error processing query: {e}", file=sys.stderr)
 
 
 def main():
@@ -2,6 +2,7 @@
 
 from .ai_module import AIModule
 from .gpt4all_client import GPT4AllClient
+from .request_queue import LatestRequestQueue
 
-__all__ = ["AIModule", "GPT4AllClient"]
+__all__ = ["AIModule", "GPT4AllClient", "LatestRequestQueue"]
 
@@ -1,7 +1,7 @@
 """Base AI module interface"""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 
 class AIModule(ABC):
@@ -9,7 +9,10 @@ class AIModule(ABC):
 
     @abstractmethod
     def generate_response(
-        self, user_query: str, context: Optional[Dict[str, Any]] = None
+        self,
+        user_query: str,
+        context: Optional[Dict[str, Any]] = None,
+        on_sentence: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
         Generate AI response to user query
@@ -17,6 +20,8 @@ class AIModule(ABC):
         Args:
             user_query: User's question or command
             context: Optional telemetry context
+            on_sentence: Optional callback invoked with each complete sentence
+                as soon as it is generated (e.g. to start TTS early)
 
         Returns:
             AI-generated response string
@@ -33,3 +38,6 @@ class AIModule(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release any resources held by the AI module"""
+        pass
@@ -1,44 +1,225 @@
 """GPT4All client for local LLM interaction"""
 
 import logging
+import os
+import re
+import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .ai_module import AIModule
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundary: terminal punctuation followed by whitespace (so decimals
+# like "45.2L" are not split mid-number)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Queries answered per chat session before it is reset, so old turns and stale
+# telemetry don't fill the model's context window
+_SESSION_MAX_TURNS = 8
+
+# Quantization levels of the default model, largest first. K-quants keep more
+# quality per bit than legacy Q4_0 (Q4_K_M is slightly larger than Q4_0 but
+# closer to the full-precision model); each step down trades a little quality
+# for size and memory. If a level fails to load (missing file, out of memory)
+# the next one is tried.
+_QUANT_MODELS = (
+    ("q4_k_m", "mistral-7b-instruct-v0.2.Q4_K_M.gguf"),  # ~4.4GB
+    ("q3_k_s", "mistral-7b-instruct-v0.2.Q3_K_S.gguf"),  # ~3.2GB
+    ("iq3_xs", "mistral-7b-instruct-v0.2.IQ3_XS.gguf"),  # ~3.0GB
+    ("q2_k", "mistral-7b-instruct-v0.2.Q2_K.gguf"),  # ~2.7GB
+)
+_QUANT_LEVELS = tuple(level for level, _ in _QUANT_MODELS)
+_DEFAULT_QUANT = "q4_k_m"
+_LOW_MEMORY_QUANT = "iq3_xs"
+_LOW_MEMORY_BYTES = 16 * 1024 ** 3
+_DEFAULT_MODEL_NAME = dict(_QUANT_MODELS)[_DEFAULT_QUANT]
+_LOW_MEMORY_MODEL_NAME = dict(_QUANT_MODELS)[_LOW_MEMORY_QUANT]
+# Last resort if no quantized file is available locally (it can be downloaded
+# from the GPT4All catalog)
+_FALLBACK_MODEL_NAME = "mistral-7b-instruct-v0.1.Q4_0.gguf"
+
+# Generation stops when the model starts another turn
+_STOP_SEQUENCES = ("\nPiloto:", "\nDriver:", "\nQ:", "\n\n")
+_STOP_WINDOW = max(len(stop) for stop in _STOP_SEQUENCES)
+
+# Tire temperature order and compact format (%-formatting is cheapest for a
+# fixed all-numeric template)
+_TIRE_KEYS = ("front_left", "front_right", "rear_left", "rear_right")
+_TIRES_FMT = "Tires:FL%.0f FR%.0f RL%.0f RR%.0f"
+# Fetches all four temperatures as a tuple in one C-level call
+_tire_values = itemgetter(*_TIRE_KEYS)
+
+# Prompt tokens evaluated per batch during prefill; large enough that the
+# context + question prompt is processed in a single pass
+_N_BATCH = 2048
+
+# Thread counts tried by the optional startup sweep; the fastest is kept.
+# Decode is memory-bound, so the best count is often below the core count
+# (hybrid P/E-core and power-limited CPUs in particular)
+_SWEEP_THREADS = (2, 4, 6, 8)
+_SWEEP_PROMPT = "Give a short radio check to your driver."
+_SWEEP_TOKENS = 20
+# Upper bound for the auto-detected thread count
+_MAX_AUTO_THREADS = 8
+
+# Compact (key, format) descriptors for the prompt's telemetry line, applied
+# in order and skipping missing values (lap times are formatted separately:
+# a zero lap time means none yet and is skipped too)
+_CURRENT_FIELDS = (
+    ("speed", "S:{:.0f}"),
+    ("rpm", "RPM:{}"),
+    ("gear", "G:{}"),
+    ("fuel", "F:{:.1f}L"),
+)
+_DELTA_FIELDS = (
+    ("speed", "ΔS:{:+.1f}"),
+    ("rpm", "ΔRPM:{:+d}"),
+    ("fuel", "ΔF:{:.3f}L"),
+)
+_ANALYSIS_FIELDS = (
+    ("tire_temp_trend", "TireTrend:{}"),
+    ("fuel_consumption_rate", "FuelRate:{:.3f}L/s"),
+)
+
+# One-token prompt used to warm up the model (allocators and KV buffers)
+# before the first real query
+_WARMUP_PROMPT = "Radio check."
+
+# Response cache for recurring driver questions ("fuel ok?", "tire temps?")
+_CACHE_TTL = 30.0  # seconds
+_CACHE_MAX_ENTRIES = 256
+_QUERY_NORMALIZE = re.compile(r"[^\w\s]+")
+
+# Language-specific system prompts (resolved once per client)
+_SYSTEM_PROMPTS = {
+    "es": """Eres ingeniero F1. Responde en español, 1-2 frases, directo y técnico.""",
+
+    "en": """You are an F1 race engineer. Respond in English, 1-2 sentences, direct and technical.""",
+
+    "fr": """Tu es ingénieur F1. Réponds en français, 1-2 phrases, direct et technique.""",
+}
+
+# Language-specific error messages
+_ERROR_MSGS = {
+    "es": {
+        "unavailable": "Modelo GPT4All no disponible. Verifica la instalación.",
+        "empty": "No pude generar una respuesta.",
+        "technical": "Problema técnico, repite la pregunta.",
+    },
+    "en": {
+        "unavailable": "Sorry, GPT4All model is not available. Please check installation.",
+        "empty": "I couldn't generate a response.",
+        "technical": "Technical issue, please repeat the question.",
+    },
+    "fr": {
+        "unavailable": "Modèle GPT4All non disponible. Vérifiez l'installation.",
+        "empty": "Je n'ai pas pu générer de réponse.",
+        "technical": "Problème technique, répète la question.",
+    },
+}
+
+
+def _trim_stop_sequences(text: str) -> str:
+    """Cut text at the first stop sequence, including a partial one at the end"""
+    for stop in _STOP_SEQUENCES:
+        index = text.find(stop)
+        if index != -1:
+            text = text[:index]
+    # The token completing a stop sequence is dropped, so a prefix may remain
+    for stop in _STOP_SEQUENCES:
+        for length in range(len(stop) - 1, 0, -1):
+            if text.endswith(stop[:length]):
+                text = text[:-length]
+                break
+    return text
+
+
+def _total_memory() -> Optional[int]:
+    """Return total physical memory in bytes, or None if it can't be determined"""
+    try:
+        import psutil
+
+        return psutil.virtual_memory().total
+    except ImportError:
+        pass
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _default_thread_count() -> int:
+    """Return the inference thread count: physical cores, capped at _MAX_AUTO_THREADS"""
+    cores = None
+    try:
+        import psutil
+
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        pass
+    return min(cores or os.cpu_count() or 4, _MAX_AUTO_THREADS)
+
 
 class GPT4AllClient(AIModule):
     """Client for interacting with GPT4All local LLM"""
 
     def __init__(
         self,
-        model_name: str = "mistral-7b-instruct-v0.1.Q4_0.gguf",
+        model_name: Optional[str] = None,
         model_path: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 150,
-        n_threads: int = 4,
+        n_threads: Optional[int] = None,
         language: str = "es",
+        thread_sweep: bool = False,
+        quantization: Optional[str] = None,
     ):
         """
         Initialize GPT4All client
 
         Args:
-            model_name: Name of the model file to use
+            model_name: Name of the model file to use (None picks a quantized
+                default based on available memory)
             model_path: Optional path to model directory (defaults to GPT4All default)
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
-            n_threads: Number of threads for inference
+            n_threads: Number of threads for inference (None uses the
+                physical core count, capped at 8)
             language: Language code for responses (es, en, fr, etc.)
+            thread_sweep: Benchmark several thread counts after loading and
+                keep the fastest (the result is left in n_threads)
+            quantization: Starting quantization level when model_name is None
+                ("q4_k_m", "q3_k_s", "iq3_xs" or "q2_k"; None picks by RAM)
         """
         self.model_name = model_name
         self.model_path = model_path
         self.temperature = temperature
         self.max_tokens = max_tokens
-        self.n_threads = n_threads
+        self.n_threads = n_threads if n_threads else _default_thread_count()
+        self.thread_sweep = thread_sweep
+        # True once a sweep has timed at least one thread count
+        self.thread_sweep_measured = False
+        self.quantization = quantization.lower() if quantization else None
         self.language = language.lower()
+        # Default to English if language not found
+        self._system_prompt = _SYSTEM_PROMPTS.get(self.language, _SYSTEM_PROMPTS["en"])
+        self._error_msgs = _ERROR_MSGS.get(self.language, _ERROR_MSGS["en"])
+        self._set_prompt_templates(include_system_prompt=True)
         self.model = None
+        # Persistent chat session: the system prompt is evaluated once and its
+        # KV cache reused, so each query only prefills the new tokens
+        self._session = None
+        self._session_turns = 0
+        self._lock = threading.Lock()  # Model and session are not thread-safe
+        # (query, coarse context bucket) -> (stored at, response), LRU ordered
+        self._cache: "OrderedDict[Tuple[str, tuple], Tuple[float, str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # (telemetry timestamp, formatted context) of the last prompt built
+        self._context_text: Tuple[Optional[float], str] = (None, "")
         self._initialize_model()
 
     def _initialize_model(self) -> None:
@@ -46,38 +227,58 @@ class GPT4AllClient(AIModule):
         try:
             from gpt4all import GPT4All
 
-            logger.info(f"Initializing GPT4All with model: {self.model_name}")
+            if self.model_name is None:
+                candidates = self._quantization_ladder(self._select_quantization())
+            else:
+                candidates = [self.model_name]
+            self.model_name = candidates[0]
+
+            logger.info("Initializing GPT4All with model: %s", self.model_name)
             print(f"Initializing GPT4All with model: {self.model_name}")
             print("Note: First run will download the model automatically (~4GB). This may take a few minutes...")
             
-            logger.debug(f"Model path: {self.model_path or 'default'}, Threads: {self.n_threads}")
+            logger.debug("Model path: %s, Threads: %s", self.model_path or 'default', self.n_threads)
             
-            # GPT4All will automatically download the model if it doesn't exist
-            # The model_path parameter is optional - if None, uses default GPT4All directory
-            init_start = time.time()
-            self.model = GPT4All(
-                model_name=self.model_name,
-                model_path=self.model_path,
-                n_threads=self.n_threads,
-            )
-            init_time = time.time() - init_start
+            init_start = time.perf_counter()
+            for index, name in enumerate(candidates):
+                self.model_name = name
+                try:
+                    self.model = self._load_model(GPT4All)
+                    break
+                except Exception as e:
+                    if index == len(candidates) - 1:
+                        raise
+                    logger.warning("Could not load %s (%s), trying %s", self.model_name, e, candidates[index + 1])
+            init_time = time.perf_counter() - init_start
             
-            logger.info(f"GPT4All model loaded successfully in {init_time:.2f}s")
+            logger.info("GPT4All model loaded successfully in %.2fs", init_time)
             print(f"✓ GPT4All model '{self.model_name}' loaded successfully!")
-            
+
+            if self.thread_sweep:
+                self._sweep_threads()
+
+            # Before the session opens, so the warmup turn isn't recorded in
+            # its history
+            self._warmup()
+            self._open_session()
+
         except ImportError:
             logger.error("GPT4All not installed")
             print("ERROR: GPT4All not installed.")
             print("Install with: pip install gpt4all")
             self.model = None
         except Exception as e:
-            logger.error(f"Failed to initialize GPT4All model: {e}", exc_info=True)
+            logger.error("Failed to initialize GPT4All model: %s", e, exc_info=True)
             print(f"ERROR: Failed to initialize GPT4All model: {e}")
             print(f"Model name: {self.model_name}")
             print("\nThis model may no longer be available. Try one of these alternatives:")
             print("  - mistral-7b-instruct-v0.1.Q4_0.gguf (recommended, ~4GB)")
             print("  - orca-mini-3b-gguf2-q4_0.gguf (smaller, faster, ~2GB)")
             print("  - llama-2-7b-chat.Q4_0.gguf (~4GB)")
+            print("\nK-quant files placed in the model directory can be used too:")
+            print(f"  - {_DEFAULT_MODEL_NAME} (~4.4GB, closer to full quality than Q4_0)")
+            print(f"  - {_LOW_MEMORY_MODEL_NAME} (~3GB, slightly lower quality)")
+            print("  (or set model_name: null and quantization: q4_k_m / q3_k_s / iq3_xs / q2_k)")
             print("\nUpdate the 'model_name' in config.yaml with one of the above.")
             print("Check all available models at: https://gpt4all.io/index.html")
             print("\nMake sure you have internet connection for first-time model download.")
@@ -85,91 +286,291 @@ class GPT4AllClient(AIModule):
             traceback.print_exc()
             self.model = None
 
+    def _load_model(self, gpt4all_cls):
+        """Construct the GPT4All model for the current model name"""
+        # GPT4All will automatically download the model if it doesn't exist
+        # The model_path parameter is optional - if None, uses default GPT4All directory
+        return gpt4all_cls(
+            model_name=self.model_name,
+            model_path=self.model_path,
+            n_threads=self.n_threads,
+        )
+
+    def _select_quantization(self) -> str:
+        """Return the configured quantization level, or pick one by RAM"""
+        if self.quantization in _QUANT_LEVELS:
+            logger.info("Using configured quantization: %s", self.quantization)
+            return self.quantization
+        if self.quantization is not None:
+            logger.warning("Unknown quantization %r, expected one of %s", self.quantization, ", ".join(_QUANT_LEVELS))
+
+        total = _total_memory()
+        if total is not None and total <= _LOW_MEMORY_BYTES:
+            logger.info("%.0fGB RAM detected, using quantization %s", total / 1024 ** 3, _LOW_MEMORY_QUANT)
+            return _LOW_MEMORY_QUANT
+        logger.info("Using quantization %s", _DEFAULT_QUANT)
+        return _DEFAULT_QUANT
+
+    @staticmethod
+    def _quantization_ladder(level: str) -> List[str]:
+        """Model files to try from a quantization level down, then the fallback"""
+        start = _QUANT_LEVELS.index(level)
+        return [name for _, name in _QUANT_MODELS[start:]] + [_FALLBACK_MODEL_NAME]
+
+    def _sweep_threads(self) -> None:
+        """Time a short generation per candidate thread count and keep the fastest"""
+        candidates = [n for n in _SWEEP_THREADS if n <= (os.cpu_count() or 4)] or [self.n_threads]
+        timings = {}
+        for n_threads in candidates:
+            try:
+                self.model.model.set_thread_count(n_threads)
+                start = time.perf_counter()
+                self.model.generate(_SWEEP_PROMPT, max_tokens=_SWEEP_TOKENS, streaming=False)
+                timings[n_threads] = time.perf_counter() - start
+            except Exception as e:
+                logger.warning("Thread sweep failed at %d threads: %s", n_threads, e)
+                break
+            logger.debug("Thread sweep: %d threads -> %.2fs", n_threads, timings[n_threads])
+
+        if timings:
+            self.n_threads = min(timings, key=timings.get)
+            self.thread_sweep_measured = True
+            logger.info("Thread sweep picked %d threads", self.n_threads)
+        try:
+            self.model.model.set_thread_count(self.n_threads)
+        except Exception as e:
+            logger.debug("Could not restore thread count: %s", e)
+
+    def _warmup(self) -> None:
+        """
+        Run a 1-token generation so the first live query isn't a cold start
+
+        Called outside any chat session (a generation inside one would be
+        recorded as a turn of the conversation).
+        """
+        warmup_start = time.perf_counter()
+        try:
+            self.model.generate(_WARMUP_PROMPT, max_tokens=1, streaming=False)
+        except Exception as e:
+            logger.warning("Model warmup failed: %s", e)
+            return
+        logger.info("Model warmed up in %.2fs", time.perf_counter() - warmup_start)
+
+    def _open_session(self) -> None:
+        """Enter a chat session seeded with the system prompt"""
+        try:
+            self._session = self.model.chat_session(self._system_prompt)
+            self._session.__enter__()
+            self._session_turns = 0
+            self._set_prompt_templates(include_system_prompt=False)
+            logger.debug("Chat session opened")
+        except Exception as e:
+            logger.warning("Could not open chat session, prompts will include the system prompt: %s", e)
+            self._session = None
+
+    def _close_session(self) -> None:
+        """Exit the current chat session"""
+        if self._session is None:
+            return
+        try:
+            self._session.__exit__(None, None, None)
+        except Exception as e:
+            logger.debug("Error closing chat session: %s", e)
+        self._session = None
+        self._set_prompt_templates(include_system_prompt=True)
+
+    def _reset_session(self) -> None:
+        """Replace the chat session with a fresh one (caller must hold the lock)"""
+        logger.debug("Resetting chat session")
+        self._close_session()
+        self._open_session()
+
+    def close(self) -> None:
+        """Release the chat session"""
+        with self._lock:
+            self._close_session()
+
     def generate_response(
-        self, user_query: str, context: Optional[Dict[str, Any]] = None
+        self,
+        user_query: str,
+        context: Optional[Dict[str, Any]] = None,
+        on_sentence: Optional[Callable[[str], None]] = None,
     ) -> str:
         """
-        Generate AI response using GPT4All
+        Generate AI response using GPT4All (tokens are streamed as they arrive)
 
         Args:
             user_query: User's question or command
             context: Optional telemetry context
+            on_sentence: Optional callback invoked with each complete sentence
+                while the rest of the response is still being generated
 
         Returns:
             AI-generated response string
         """
         if not self.model:
             logger.error("Model not available for response generation")
-            error_messages = {
-                "es": "Modelo GPT4All no disponible. Verifica la instalación.",
-                "en": "Sorry, GPT4All model is not available. Please check installation.",
-                "fr": "Modèle GPT4All non disponible. Vérifiez l'installation.",
-            }
-            return error_messages.get(self.language, error_messages["en"])
+            return self._error_msgs["unavailable"]
+
+        # Same question in roughly the same race situation: skip inference
+        cache_key = self._cache_key(user_query, context)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            logger.info("Response served from cache")
+            if on_sentence is not None:
+                for sentence in _SENTENCE_END.split(cached):
+                    self._emit_sentence(on_sentence, sentence)
+            return cached
+
+        with self._lock:
+            return self._generate_locked(user_query, context, on_sentence, cache_key)
+
+    @staticmethod
+    def _cache_key(user_query: str, context: Optional[Dict[str, Any]]) -> Tuple[str, tuple]:
+        """Build a cache key from the normalized query and bucketed telemetry"""
+        query = " ".join(_QUERY_NORMALIZE.sub(" ", user_query.lower()).split())
+        current = context.get("current", {}) if context else {}
+        speed = current.get("speed")
+        fuel = current.get("fuel")
+        bucket = (
+            round(speed / 20) if speed is not None else None,
+            current.get("gear"),
+            round(fuel / 5) if fuel is not None else None,
+        )
+        return query, bucket
+
+    def _cache_lookup(self, key: Tuple[str, tuple]) -> Optional[str]:
+        """Return a cached response if present and not expired"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > _CACHE_TTL:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return response
 
+    def _cache_store(self, key: Tuple[str, tuple], response: str) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def _generate_locked(
+        self,
+        user_query: str,
+        context: Optional[Dict[str, Any]],
+        on_sentence: Optional[Callable[[str], None]],
+        cache_key: Tuple[str, tuple],
+    ) -> str:
+        """Run inference (caller must hold the lock)"""
         logger.debug("Building prompt with context...")
         # Build prompt with context
         prompt = self._build_prompt(user_query, context)
-        logger.debug(f"Prompt length: {len(prompt)} characters")
+        logger.debug("Prompt length: %d characters", len(prompt))
         
         # Log the full prompt for debugging
-        logger.debug("=" * 80)
-        logger.debug("PROMPT SENT TO GPT4All:")
-        logger.debug("-" * 80)
-        logger.debug(prompt)
-        logger.debug("-" * 80)
-        logger.debug("=" * 80)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("=" * 80)
+            logger.debug("PROMPT SENT TO GPT4All:")
+            logger.debug("-" * 80)
+            logger.debug(prompt)
+            logger.debug("-" * 80)
+            logger.debug("=" * 80)
 
         try:
             logger.info("Starting GPT4All inference...")
-            logger.debug(f"Parameters: temp={self.temperature}, max_tokens={self.max_tokens}, threads={self.n_threads}")
+            logger.debug("Parameters: temp=%s, max_tokens=%s, threads=%s", self.temperature, self.max_tokens, self.n_threads)
             
             # Generate response with maximum speed optimizations
             # Aggressive parameters for fastest possible generation
-            gen_start = time.time()
-            # Limit tokens aggressively for speed
-            max_tokens_limited = min(self.max_tokens, 50)
-            response = self.model.generate(
+            gen_start = time.perf_counter()
+            # Short questions get short token budgets (decode time is linear
+            # in tokens generated)
+            max_tokens_limited = min(self.max_tokens, 30 + 3 * len(user_query.split()))
+
+            # Stop as soon as the model starts a new turn instead of padding.
+            # Whitespace before the first word is dropped, so a reply that
+            # opens with a blank line doesn't match "\n\n"
+            recent = ""
+
+            def stop_on_turn_boundary(token_id: int, token: str) -> bool:
+                nonlocal recent
+                if not recent:
+                    token = token.lstrip()
+                recent = (recent + token)[-_STOP_WINDOW:]
+                return not any(stop in recent for stop in _STOP_SEQUENCES)
+
+            tokens = self.model.generate(
                 prompt,
-                streaming=False,
+                streaming=True,
                 temp=self.temperature,
                 max_tokens=max_tokens_limited,
                 top_k=10,  # Very low for faster generation
                 top_p=0.5,  # Lower for faster, more deterministic
                 repeat_penalty=1.05,  # Lower penalty for speed
-                n_batch=512,  # Larger batch for better throughput
+                n_batch=_N_BATCH,
+                callback=stop_on_turn_boundary,
             )
-            gen_time = time.time() - gen_start
-            
-            # Get language-specific error messages
-            error_messages = {
-                "es": "No pude generar una respuesta.",
-                "en": "I couldn't generate a response.",
-                "fr": "Je n'ai pas pu générer de réponse.",
-            }
-            default_error = error_messages.get(self.language, error_messages["en"])
+
+            # Hand complete sentences to the caller while decoding continues
+            text = ""
+            emitted = 0  # Characters of text already passed to on_sentence
+            for token in tokens:
+                if not text:
+                    token = token.lstrip()
+                text += token
+                if on_sentence is None:
+                    continue
+                for match in _SENTENCE_END.finditer(text, emitted):
+                    self._emit_sentence(on_sentence, text[emitted:match.start()])
+                    emitted = match.end()
+
+            response = _trim_stop_sequences(text)
+            if on_sentence is not None and len(response) > emitted:
+                self._emit_sentence(on_sentence, response[emitted:])
+            gen_time = time.perf_counter() - gen_start
+            self._session_turns += 1
+            # Roll over now rather than at the start of the next query, while
+            # the reply has already been handed to the caller
+            if self._session is not None and self._session_turns >= _SESSION_MAX_TURNS:
+                self._reset_session()
             
-            response_text = response.strip() if response else default_error
-            logger.info(f"Inference completed in {gen_time:.2f}s, response length: {len(response_text)} chars")
-            logger.debug(f"Response preview: {response_text[:100]}...")
+            response_text = response.strip()
+            if response_text:
+                self._cache_store(cache_key, response_text)
+            else:
+                response_text = self._error_msgs["empty"]
+            logger.info("Inference completed in %.2fs, response length: %d chars", gen_time, len(response_text))
+            logger.debug("Response preview: %s...", response_text[:100])
             
             return response_text
         except Exception as e:
-            logger.error(f"Error generating response: {e}", exc_info=True)
-            print(f"Error generating response with GPT4All: {e}")
-            
-            # Language-specific error messages
-            error_messages = {
-                "es": "Problema técnico, repite la pregunta.",
-                "en": "Technical issue, please repeat the question.",
-                "fr": "Problème technique, répète la question.",
-            }
-            return error_messages.get(self.language, error_messages["en"])
+            logger.error("Error generating response: %s", e, exc_info=True)
+            return self._error_msgs["technical"]
+
+    @staticmethod
+    def _emit_sentence(on_sentence: Callable[[str], None], sentence: str) -> None:
+        """Pass a finished sentence to the streaming callback"""
+        sentence = sentence.strip()
+        if not sentence:
+            return
+        try:
+            on_sentence(sentence)
+        except Exception as e:
+            logger.error("Error in sentence callback: %s", e, exc_info=True)
 
     def _build_prompt(self, user_query: str, context: Optional[Dict[str, Any]]) -> str:
         """
         Build prompt with telemetry context (optimized for speed and configured language)
 
+        The system prompt lives in the chat session, so only the per-query
+        part (telemetry + question) is sent to the model.
+
         Args:
             user_query: User's question
             context: Telemetry context dictionary
@@ -177,36 +578,23 @@ class GPT4AllClient(AIModule):
         Returns:
             Formatted prompt string
         """
-        # Get language-specific prompt
-        system_prompt = self._get_system_prompt()
-
         if context and "current" in context:
-            context_summary = self._format_context(context)
-            # Ultra-compact prompt format for speed
-            prompt = f"""{system_prompt}
-Data: {context_summary}
-Q: {user_query}
-A:"""
-        else:
-            prompt = f"""{system_prompt}
-
-Q: {user_query}
-A:"""
+            return self._prefix_with_data + self._format_context(context) + "\nQ: " + user_query + "\nA:"
+        return self._prefix_no_data + user_query + "\nA:"
 
-        return prompt
+    def _set_prompt_templates(self, include_system_prompt: bool) -> None:
+        """
+        Pre-bake the constant prompt prefixes (queries are appended by plain
+        concatenation, so no template is parsed per call)
 
-    def _get_system_prompt(self) -> str:
-        """Get system prompt based on configured language (optimized for speed)"""
-        prompts = {
-            "es": """Eres ingeniero F1. Responde en español, 1-2 frases, directo y técnico.""",
-            
-            "en": """You are an F1 race engineer. Respond in English, 1-2 sentences, direct and technical.""",
-            
-            "fr": """Tu es ingénieur F1. Réponds en français, 1-2 phrases, direct et technique.""",
-        }
-        
-        # Default to English if language not found
-        return prompts.get(self.language, prompts["en"])
+        Args:
+            include_system_prompt: Prepend the system prompt (needed when no
+                chat session holds it)
+        """
+        prefix = self._system_prompt + "\n" if include_system_prompt else ""
+        # Ultra-compact prompt format for speed
+        self._prefix_with_data = prefix + "Data: "
+        self._prefix_no_data = prefix + "Q: "
 
     def _format_context(self, context: Dict[str, Any]) -> str:
         """
@@ -216,64 +604,68 @@ A:"""
         - If connected to Assetto Corsa: Real-time telemetry from shared memory
         - If not connected: Mock/test data (see assetto_corsa_reader._read_mock_data)
         """
-        parts = []
         current = context.get("current", {})
 
+        # The whole context is derived from one telemetry sample, so an
+        # unchanged timestamp means an unchanged string
+        timestamp = current.get("timestamp")
+        cached_timestamp, cached_text = self._context_text
+        if timestamp is not None and timestamp == cached_timestamp:
+            return cached_text
+
         # Compact format: key:value pairs separated by commas
-        # Current telemetry values
-        if "speed" in current:
-            parts.append(f"S:{current['speed']:.0f}")
-        if "rpm" in current:
-            parts.append(f"RPM:{current['rpm']}")
-        if "gear" in current:
-            parts.append(f"G:{current['gear']}")
-        if "fuel" in current:
-            parts.append(f"F:{current['fuel']:.1f}L")
-        if "lap_time" in current and current.get("lap_time"):
-            parts.append(f"Lap:{current['lap_time']:.1f}s")
-        if "best_lap_time" in context and context["best_lap_time"]:
-            parts.append(f"Best:{context['best_lap_time']:.1f}s")
-        if "tire_temperatures" in current:
-            temps = current["tire_temperatures"]
-            parts.append(f"Tires:FL{temps.get('front_left', 0):.0f} FR{temps.get('front_right', 0):.0f} RL{temps.get('rear_left', 0):.0f} RR{temps.get('rear_right', 0):.0f}")
+        # Current telemetry values (one lookup per field, missing ones skipped)
+        parts = [
+            fmt.format(value)
+            for key, fmt in _CURRENT_FIELDS
+            if (value := current.get(key)) is not None
+        ]
+        if lap_time := current.get("lap_time"):
+            parts.append(f"Lap:{lap_time:.1f}s")
+        if best := context.get("best_lap_time"):
+            parts.append(f"Best:{best:.1f}s")
+        temps = current.get("tire_temperatures")
+        if temps is not None:
+            try:
+                values = _tire_values(temps)
+            except KeyError:
+                values = tuple(temps.get(k, 0) for k in _TIRE_KEYS)
+            parts.append(_TIRES_FMT % values)
         
         # Include deltas if available (rate of change)
-        deltas = context.get("deltas", {})
+        deltas = context.get("deltas")
         if deltas:
-            delta_parts = []
-            if "speed" in deltas:
-                delta_parts.append(f"ΔS:{deltas['speed']:+.1f}")
-            if "rpm" in deltas:
-                delta_parts.append(f"ΔRPM:{deltas['rpm']:+d}")
-            if "fuel" in deltas:
-                delta_parts.append(f"ΔF:{deltas['fuel']:.3f}L")
+            delta_parts = [
+                fmt.format(value)
+                for key, fmt in _DELTA_FIELDS
+                if (value := deltas.get(key)) is not None
+            ]
             if delta_parts:
                 parts.append("Deltas:" + " ".join(delta_parts))
         
         # Include performance analysis if available
-        analysis = context.get("analysis", {})
+        analysis = context.get("analysis")
         if analysis:
-            analysis_parts = []
-            if "tire_temp_trend" in analysis:
-                trend = analysis["tire_temp_trend"]
-                analysis_parts.append(f"TireTrend:{trend}")
-            if "fuel_consumption_rate" in analysis:
-                rate = analysis["fuel_consumption_rate"]
-                analysis_parts.append(f"FuelRate:{rate:.3f}L/s")
+            analysis_parts = [
+                fmt.format(value)
+                for key, fmt in _ANALYSIS_FIELDS
+                if (value := analysis.get(key)) is not None
+            ]
             if analysis_parts:
                 parts.append("Analysis:" + " ".join(analysis_parts))
         
         # Position information if available
-        if "position" in current:
-            parts.append(f"Pos:P{current['position']}")
+        if (position := current.get("position")) is not None:
+            parts.append(f"Pos:P{position}")
 
         formatted = ", ".join(parts)
+        self._context_text = (timestamp, formatted)
         
         # Log data source for debugging
         if current.get("_is_mock"):
-            logger.debug(f"[MOCK DATA] Telemetry: {formatted}")
+            logger.debug("[MOCK DATA] Telemetry: %s", formatted)
         else:
-            logger.debug(f"[REAL DATA] Telemetry: {formatted}")
+            logger.debug("[REAL DATA] Telemetry: %s", formatted)
         
         return formatted
 
@@ -0,0 +1,65 @@
+"""Debounced request queue for AI queries"""
+
+import threading
+from typing import Any, Optional
+
+
+class LatestRequestQueue:
+    """
+    Single-slot queue where a new request replaces the pending one
+
+    Inference takes seconds while requests can arrive much faster, so only
+    the most recent pending request is worth answering; older ones would be
+    answered against obsolete telemetry.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue"""
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._pending: Any = None
+        self._has_pending = False
+        self._closed = False
+
+    def submit(self, request: Any) -> bool:
+        """
+        Queue a request without blocking, replacing any pending one
+
+        Args:
+            request: Request to hand to the consumer
+
+        Returns:
+            True if a pending request was dropped in favour of this one
+        """
+        with self._lock:
+            replaced = self._has_pending
+            self._pending = request
+            self._has_pending = True
+            self._ready.set()
+        return replaced
+
+    def get(self) -> Optional[Any]:
+        """
+        Wait for the next request
+
+        Returns:
+            The latest submitted request, or None once the queue is closed
+        """
+        while True:
+            self._ready.wait()
+            with self._lock:
+                if self._closed:
+                    return None
+                if self._has_pending:
+                    request = self._pending
+                    self._pending = None
+                    self._has_pending = False
+                    self._ready.clear()
+                    return request
+                self._ready.clear()
+
+    def close(self) -> None:
+        """Wake the consumer and make get() return None"""
+        with self._lock:
+            self._closed = True
+            self._ready.set()
@@ -1,5 +1,6 @@
 """Configuration management module"""
 
+from .app_config import AppConfig
 from .config_manager import ConfigManager
 
-__all__ = ["ConfigManager"]
+__all__ = ["ConfigManager", "AppConfig"]
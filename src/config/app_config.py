@@ -0,0 +1,61 @@
+"""Typed configuration snapshot for ApexEngineer"""
+
+from dataclasses import dataclass, fields
+from typing import Optional
+
+from .config_manager import ConfigManager
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """
+    Immutable snapshot of the application configuration
+
+    Field names are "<section>_<key>" and map to the dotted config path
+    "<section>.<key>" (e.g. ai_model_name -> "ai.model_name"). Defaults are
+    used when a key is missing from the config file. With thread_sweep on,
+    a thread count already measured by an earlier sweep is used instead of
+    sweeping again.
+    """
+
+    logging_level: str = "INFO"
+
+    ai_model_name: Optional[str] = None  # None: quantized default picked by RAM
+    ai_model_path: Optional[str] = None
+    ai_temperature: float = 0.7
+    ai_max_tokens: int = 150
+    ai_n_threads: Optional[int] = None  # None: physical cores, capped at 8
+    ai_thread_sweep: bool = False
+    ai_quantization: Optional[str] = None  # None: q4_k_m, or iq3_xs on low RAM
+    ai_language: str = "es"
+
+    telemetry_update_rate: float = 10
+
+    voice_stt_enabled: bool = True
+    voice_tts_enabled: bool = False
+    voice_push_to_talk_key: str = "SPACE"
+    voice_microphone_index: Optional[int] = None
+    voice_whisper_model: str = "tiny.en"
+    voice_stt_backend: str = "auto"  # auto, faster-whisper or whisper
+
+    @classmethod
+    def from_config(cls, config: ConfigManager) -> "AppConfig":
+        """
+        Build a snapshot from a configuration manager
+
+        Args:
+            config: Loaded configuration manager
+
+        Returns:
+            AppConfig with every field resolved once
+        """
+        values = {}
+        for field in fields(cls):
+            section, _, key = field.name.partition("_")
+            values[field.name] = config.get(f"{section}.{key}", field.default)
+        if values["ai_thread_sweep"]:
+            swept = config.get_tuning().get("ai.n_threads")
+            if isinstance(swept, int) and swept > 0:
+                values["ai_n_threads"] = swept
+                values["ai_thread_sweep"] = False
+        return cls(**values)
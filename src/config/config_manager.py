@@ -1,11 +1,20 @@
 """Configuration manager for ApexEngineer"""
 
+import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used instead
+    orjson = None
+
+# Cached marker for key paths that are not in the config
+_MISSING = object()
+
 
 class ConfigManager:
     """Manages application configuration from YAML file"""
@@ -18,21 +27,112 @@ class ConfigManager:
             config_path: Path to configuration YAML file
         """
         self.config_path = Path(config_path)
+        # Parsed copy of the YAML file, reloaded much faster than YAML
+        self.cache_path = self.config_path.with_suffix(".cache.json")
+        # Values measured at runtime (e.g. the thread sweep winner), kept out
+        # of the hand-edited YAML file
+        self.tuning_path = self.config_path.with_suffix(".tuning.json")
         self.config: Dict[str, Any] = {}
+        # Resolved values by key path; cleared whenever the config changes
+        self._path_cache: Dict[str, Any] = {}
         self.load_config()
 
     def load_config(self) -> None:
         """Load configuration from YAML file"""
+        self._path_cache.clear()
         if not self.config_path.exists():
             self.create_default_config()
             return
 
+        try:
+            stat = self.config_path.stat()
+            source = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            source = None
+
+        cached = self._load_cache(source)
+        if cached is not None:
+            self.config = cached
+            return
+
         try:
             with open(self.config_path, "r", encoding="utf-8") as f:
                 self.config = yaml.safe_load(f) or {}
         except Exception as e:
             print(f"Error loading config: {e}")
             self.config = self.get_default_config()
+            return
+        if source is not None:
+            self._write_cache(source)
+
+    def _load_cache(self, source: Optional[list]) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached config if it was built from this exact YAML file
+
+        The cache is used only when both values match the ones recorded with
+        it, so a YAML file restored with an older mtime is still picked up.
+
+        Args:
+            source: [st_mtime_ns, st_size] of the YAML file
+        """
+        if source is None:
+            return None
+        try:
+            data = self.cache_path.read_bytes()
+            cache = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("source") != source:
+            return None
+        config = cache.get("config")
+        return config if isinstance(config, dict) else None
+
+    def _write_cache(self, source: list) -> None:
+        """Write the parsed config and its YAML file's stat next to it (best effort)"""
+        cache = {"source": source, "config": self.config}
+        try:
+            if orjson is not None:
+                data = orjson.dumps(cache)
+            else:
+                data = json.dumps(cache).encode("utf-8")
+            self.cache_path.write_bytes(data)
+        except (OSError, TypeError, ValueError):
+            # Unwritable directory or values JSON can't represent: parse the
+            # YAML next time instead
+            pass
+
+    def get_tuning(self) -> Dict[str, Any]:
+        """
+        Load the measured values, keyed by dotted config path
+
+        Returns:
+            Dictionary of tuned values (empty if none were saved)
+        """
+        try:
+            data = self.tuning_path.read_bytes()
+            tuning = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return {}
+        return tuning if isinstance(tuning, dict) else {}
+
+    def set_tuning(self, key_path: str, value: Any) -> None:
+        """
+        Save a measured value to the tuning file (best effort)
+
+        Args:
+            key_path: Dot-separated config path the value applies to
+            value: JSON-serializable value
+        """
+        tuning = self.get_tuning()
+        tuning[key_path] = value
+        try:
+            if orjson is not None:
+                data = orjson.dumps(tuning)
+            else:
+                data = json.dumps(tuning).encode("utf-8")
+            self.tuning_path.write_bytes(data)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error saving tuning values: {e}")
 
     def create_default_config(self) -> None:
         """Create default configuration file if it doesn't exist"""
@@ -47,12 +147,14 @@ class ConfigManager:
         return {
             "ai": {
                 "model": "gpt4all",
-                "model_name": "ggml-gpt4all-j-v1.3-groovy.bin",
+                "model_name": None,
+                "quantization": None,
                 "model_path": None,
                 "endpoint": "http://localhost:11434",
                 "temperature": 0.7,
                 "max_tokens": 150,
-                "n_threads": 4,
+                "n_threads": None,
+                "thread_sweep": False,
             },
             "telemetry": {
                 "game": "assetto_corsa",
@@ -63,6 +165,8 @@ class ConfigManager:
                 "stt_enabled": True,
                 "tts_enabled": False,
                 "microphone_index": None,
+                "whisper_model": "tiny.en",
+                "stt_backend": "auto",
             },
         }
 
@@ -77,15 +181,21 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split(".")
-        value = self.config
+        value = self._path_cache.get(key_path, _MISSING)
+        if value is not _MISSING:
+            return value
+        if key_path in self._path_cache:
+            return default
 
-        for key in keys:
+        value = self.config
+        for key in key_path.split("."):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
+                self._path_cache[key_path] = _MISSING
                 return default
 
+        self._path_cache[key_path] = value
         return value
 
     def set(self, key_path: str, value: Any) -> None:
@@ -96,6 +206,7 @@ class ConfigManager:
             key_path: Dot-separated path to config value
             value: Value to set
         """
+        self._path_cache.clear()
         keys = key_path.split(".")
         config = self.config
 
@@ -108,5 +219,6 @@ class ConfigManager:
 
     def save(self) -> None:
         """Save current configuration to file"""
+        self._path_cache.clear()
         with open(self.config_path, "w", encoding="utf-8") as f:
             yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
@@ -0,0 +1,69 @@
+"""JIT-compiled telemetry math (falls back to plain Python without numba)"""
+
+import math
+import os
+from pathlib import Path
+from typing import Tuple
+
+# Compiled kernels are cached on disk so only the very first run pays for
+# compilation; numba reads this when it is imported
+os.environ.setdefault("NUMBA_CACHE_DIR", str(Path.home() / ".apex_cache" / "numba"))
+
+try:
+    from numba import njit
+except ImportError:  # Optional: the same functions run as plain Python
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Values passed to these kernels use NaN for missing fields, so they are
+# compiled without fastmath (which assumes NaN never occurs)
+
+
+@njit(cache=True)
+def analyze(fuel, tire_avg, timestamps, idx: int, count: int) -> Tuple[float, float, int]:
+    """
+    Trend analysis over the newest samples of the history ring buffer
+
+    Args:
+        fuel: Fuel level ring buffer (NaN = missing)
+        tire_avg: Average tire temperature ring buffer (NaN = missing)
+        timestamps: Sample time ring buffer
+        idx: Slot that will be written next (the newest sample is idx - 1)
+        count: Number of valid samples in the buffers
+
+    Returns:
+        (fuel consumption rate in L/s or NaN, tire temperature change over
+        the last 3 samples or NaN, trend flag: 1 increasing, -1 decreasing,
+        0 unknown)
+    """
+    size = len(fuel)
+    newest = (idx - 1) % size
+
+    tire_delta = math.nan
+    trend = 0
+    if count >= 3:
+        known = True
+        for back in range(1, 4):
+            if math.isnan(tire_avg[(idx - back) % size]):
+                known = False
+        if known:
+            tire_delta = tire_avg[newest] - tire_avg[(idx - 3) % size]
+            trend = 1 if tire_delta > 0 else -1
+
+    rate = math.nan
+    if count >= 5:
+        known = True
+        for back in range(1, 6):
+            if math.isnan(fuel[(idx - back) % size]):
+                known = False
+        if known:
+            oldest = (idx - 5) % size
+            elapsed = timestamps[newest] - timestamps[oldest]
+            rate = (fuel[oldest] - fuel[newest]) / elapsed if elapsed > 0.0 else 0.0
+
+    return rate, tire_delta, trend
@@ -1,13 +1,108 @@
 """Assetto Corsa shared memory telemetry reader"""
 
 import mmap
+import platform
+import random
 import struct
 import ctypes
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from .telemetry_reader import TelemetryReader
 
 
+class ACPhysics(ctypes.Structure):
+    """Leading fields of Assetto Corsa's SPageFilePhysics (acpmf_physics)"""
+
+    _pack_ = 4
+    _fields_ = [
+        ("packetId", ctypes.c_int),
+        ("gas", ctypes.c_float),
+        ("brake", ctypes.c_float),
+        ("fuel", ctypes.c_float),
+        ("gear", ctypes.c_int),  # 0 = reverse, 1 = neutral, 2 = first...
+        ("rpms", ctypes.c_int),
+        ("steerAngle", ctypes.c_float),
+        ("speedKmh", ctypes.c_float),
+        ("velocity", ctypes.c_float * 3),
+        ("accG", ctypes.c_float * 3),
+        ("wheelSlip", ctypes.c_float * 4),
+        ("wheelLoad", ctypes.c_float * 4),
+        ("wheelsPressure", ctypes.c_float * 4),
+        ("wheelAngularSpeed", ctypes.c_float * 4),
+        ("tyreWear", ctypes.c_float * 4),
+        ("tyreDirtyLevel", ctypes.c_float * 4),
+        ("tyreCoreTemperature", ctypes.c_float * 4),  # FL, FR, RL, RR
+    ]
+
+
+class ACGraphics(ctypes.Structure):
+    """Leading fields of Assetto Corsa's SPageFileGraphic (acpmf_graphics)"""
+
+    _pack_ = 4
+    _fields_ = [
+        ("packetId", ctypes.c_int),
+        ("status", ctypes.c_int),  # 0 = off, 1 = replay, 2 = live, 3 = pause
+        ("session", ctypes.c_int),
+        ("currentTime", ctypes.c_wchar * 15),
+        ("lastTime", ctypes.c_wchar * 15),
+        ("bestTime", ctypes.c_wchar * 15),
+        ("split", ctypes.c_wchar * 15),
+        ("completedLaps", ctypes.c_int),
+        ("position", ctypes.c_int),
+        ("iCurrentTime", ctypes.c_int),  # milliseconds
+        ("iLastTime", ctypes.c_int),
+        ("iBestTime", ctypes.c_int),
+    ]
+
+
+_AC_STATUS_OFF = 0
+
+# Consecutive reads with the game off or no new physics packet (~5 s at the
+# default 10 Hz) after which the mappings are released and reopened; if the
+# game is gone, the reader drops to mock data
+_STALE_READS_BEFORE_RECONNECT = 50
+
+# OpenFileMappingW access right (read-only is enough to test for the name)
+_FILE_MAP_READ = 0x0004
+
+
+def _section_exists(name: str) -> bool:
+    """Check whether a named Windows file mapping exists, without creating it"""
+    kernel32 = ctypes.windll.kernel32
+    kernel32.OpenFileMappingW.restype = ctypes.c_void_p
+    handle = kernel32.OpenFileMappingW(_FILE_MAP_READ, False, name)
+    if not handle:
+        return False
+    kernel32.CloseHandle(ctypes.c_void_p(handle))
+    return True
+
+
+# Mock data noise is drawn in batches: one row per read, refilled in the
+# background each time the table wraps (power of two for cheap wrapping)
+_NOISE_ROWS = 4096
+# Per-column ranges: speed, rpm, fuel drop, FL, FR, RL, RR tire temps, lap time
+_NOISE_LOW = (-5.0, -200.0, 0.0, -2.0, -2.0, -2.0, -2.0, -0.5)
+_NOISE_HIGH = (5.0, 200.0, 0.1, 2.0, 2.0, 2.0, 2.0, 0.5)
+
+
+def _make_noise_table() -> List[List[float]]:
+    """Generate _NOISE_ROWS rows of uniform noise (NumPy when available)"""
+    try:
+        import numpy as np
+
+        table = np.random.default_rng().uniform(_NOISE_LOW, _NOISE_HIGH, (_NOISE_ROWS, len(_NOISE_LOW)))
+        # Plain floats index faster than NumPy scalars on the read path
+        return table.tolist()
+    except ImportError:
+        # Bound C-level random() scaled by hand: uniform() is a Python
+        # wrapper around the same call
+        rand = random.random
+        ranges = tuple((low, high - low) for low, high in zip(_NOISE_LOW, _NOISE_HIGH))
+        return [[low + span * rand() for low, span in ranges] for _ in range(_NOISE_ROWS)]
+
+
 class AssettoCorsaReader(TelemetryReader):
     """Reads telemetry data from Assetto Corsa shared memory"""
 
@@ -21,7 +116,20 @@ class AssettoCorsaReader(TelemetryReader):
         self.physics_shm = None
         self.graphics_shm = None
         self.static_shm = None
+        # Persistent views over the mappings and the structures laid over
+        # them (zero-copy); released on disconnect
+        self._physics_mv: Optional[memoryview] = None
+        self._graphics_mv: Optional[memoryview] = None
+        self._physics: Optional[ACPhysics] = None
+        self._graphics: Optional[ACGraphics] = None
+        # Physics packetId seen on the previous read (unchanged = no new sample)
+        self._last_packet_id: Optional[int] = None
+        # Reads in a row that returned no new sample
+        self._stale_reads = 0
         self.connected = False
+        self._noise = _make_noise_table()
+        self._noise_idx = 0
+        self._noise_next: Optional[List[List[float]]] = None
 
     def connect(self) -> bool:
         """
@@ -33,8 +141,6 @@ class AssettoCorsaReader(TelemetryReader):
         try:
             # On Windows, use named shared memory
             # On Linux/Mac, we'll need a different approach
-            import platform
-
             if platform.system() == "Windows":
                 return self._connect_windows()
             else:
@@ -49,23 +155,52 @@ class AssettoCorsaReader(TelemetryReader):
     def _connect_windows(self) -> bool:
         """Connect to shared memory on Windows"""
         try:
-            import win32file
-            import win32con
+            if self.physics_shm is None:
+                # mmap with a tagname creates the section when it is missing,
+                # sized to our truncated structs; the game would then open
+                # that undersized section and its writes past it would be
+                # lost, so only map sections the game already created
+                names = (self.PHYSICS_SHM_NAME, self.GRAPHICS_SHM_NAME)
+                if not all(_section_exists(name) for name in names):
+                    print("Assetto Corsa is not running (shared memory not found)")
+                    return False
+
+                # Named mappings (tagname) are a Windows-only mmap feature;
+                # opening an existing section only maps the leading fields
+                physics_size = ctypes.sizeof(ACPhysics)
+                graphics_size = ctypes.sizeof(ACGraphics)
+                self.physics_shm = mmap.mmap(-1, physics_size, self.PHYSICS_SHM_NAME)
+                self.graphics_shm = mmap.mmap(-1, graphics_size, self.GRAPHICS_SHM_NAME)
+                self._physics_mv = memoryview(self.physics_shm)
+                self._graphics_mv = memoryview(self.graphics_shm)
+                self._physics = ACPhysics.from_buffer(self._physics_mv[:physics_size])
+                self._graphics = ACGraphics.from_buffer(self._graphics_mv[:graphics_size])
+
+            # Section left behind by a closed game: release it rather than
+            # holding it open
+            if self._graphics.status == _AC_STATUS_OFF:
+                print("Assetto Corsa is not running (shared memory is empty)")
+                self.disconnect()
+                return False
 
-            # Try to open shared memory objects
-            # Note: This is a simplified version - full implementation
-            # would need proper struct definitions for AC shared memory
             self.connected = True
             return True
-        except ImportError:
-            print("pywin32 required for Windows shared memory access")
-            return False
         except Exception as e:
             print(f"Error connecting to Windows shared memory: {e}")
+            self.disconnect()
             return False
 
     def disconnect(self) -> None:
         """Disconnect from shared memory"""
+        # Structures export the mmap buffers, which can't close while in use
+        self._physics = None
+        self._graphics = None
+        for view in (self._physics_mv, self._graphics_mv):
+            if view is not None:
+                view.release()
+        self._physics_mv = None
+        self._graphics_mv = None
+        self._last_packet_id = None
         if self.physics_shm:
             self.physics_shm.close()
             self.physics_shm = None
@@ -82,20 +217,71 @@ class AssettoCorsaReader(TelemetryReader):
         Read current telemetry data from Assetto Corsa
 
         Returns:
-            Dictionary with telemetry data or None if unavailable
+            Dictionary with telemetry data, or None if unavailable or if the
+            game has not published a new sample since the last read
         """
         if not self.connected:
             # Return mock data when not connected to real game
             return self._read_mock_data()
 
         try:
-            # TODO: Actual implementation would read from shared memory structures
-            # For now, return mock data even when "connected" since full implementation
-            # requires proper struct definitions for AC shared memory
-            return self._read_mock_data()
+            telemetry = self._read_shared_memory()
         except Exception as e:
             print(f"Error reading telemetry: {e}")
+            telemetry = None
+
+        if telemetry is not None:
+            self._stale_reads = 0
+            return telemetry
+        self._stale_reads += 1
+        if self._stale_reads >= _STALE_READS_BEFORE_RECONNECT:
+            self._reconnect()
+        return None
+
+    def _reconnect(self) -> None:
+        """Reopen the mappings after a run of stale reads (mock data if the game is gone)"""
+        self._stale_reads = 0
+        # Still paused after reopening: the same packet is not a new sample
+        last_packet_id = self._last_packet_id
+        self.disconnect()
+        if self.connect():
+            self._last_packet_id = last_packet_id
+        else:
+            print("Lost Assetto Corsa telemetry, using mock data")
+
+    def _read_shared_memory(self) -> Optional[Dict[str, Any]]:
+        """Build a telemetry dictionary from the mapped AC structures"""
+        physics = self._physics
+        graphics = self._graphics
+        # Game closed: nothing to report (read() reconnects after a while)
+        if graphics.status == _AC_STATUS_OFF:
+            return None
+        # No new physics packet (e.g. paused): nothing new to report
+        packet_id = physics.packetId
+        if packet_id == self._last_packet_id:
             return None
+        self._last_packet_id = packet_id
+
+        temps = physics.tyreCoreTemperature
+        best_ms = graphics.iBestTime
+
+        return {
+            "speed": physics.speedKmh,
+            "rpm": physics.rpms,
+            "gear": physics.gear - 1,  # -1 = reverse, 0 = neutral
+            "fuel": physics.fuel,
+            "tire_temperatures": {
+                "front_left": temps[0],
+                "front_right": temps[1],
+                "rear_left": temps[2],
+                "rear_right": temps[3],
+            },
+            "lap_time": graphics.iCurrentTime / 1000.0,
+            "best_lap_time": best_ms / 1000.0 if best_ms > 0 else None,
+            "current_lap": graphics.completedLaps + 1,
+            "position": graphics.position,
+            "timestamp": time.time(),
+        }
 
     def _read_mock_data(self) -> Dict[str, Any]:
         """
@@ -104,26 +290,28 @@ class AssettoCorsaReader(TelemetryReader):
         NOTE: These are STATIC test values. In production, this would read
         real-time data from Assetto Corsa shared memory.
         """
-        import time
-        import random
-
         # Add slight variations to make it more realistic for testing
         base_speed = 120.5
         base_rpm = 6500
         base_fuel = 45.2
+
+        speed_n, rpm_n, fuel_n, fl_n, fr_n, rl_n, rr_n, lap_n = self._noise[self._noise_idx]
+        self._noise_idx = (self._noise_idx + 1) & (_NOISE_ROWS - 1)
+        if self._noise_idx == 0:
+            self._swap_noise()
         
         return {
-            "speed": base_speed + random.uniform(-5, 5),  # km/h (varies slightly)
-            "rpm": int(base_rpm + random.uniform(-200, 200)),
+            "speed": base_speed + speed_n,  # km/h (varies slightly)
+            "rpm": int(base_rpm + rpm_n),
             "gear": 4,
-            "fuel": max(0, base_fuel - random.uniform(0, 0.1)),  # Slowly decreasing
+            "fuel": max(0, base_fuel - fuel_n),  # Slowly decreasing
             "tire_temperatures": {
-                "front_left": 85.0 + random.uniform(-2, 2),
-                "front_right": 87.0 + random.uniform(-2, 2),
-                "rear_left": 82.0 + random.uniform(-2, 2),
-                "rear_right": 84.0 + random.uniform(-2, 2),
+                "front_left": 85.0 + fl_n,
+                "front_right": 87.0 + fr_n,
+                "rear_left": 82.0 + rl_n,
+                "rear_right": 84.0 + rr_n,
             },
-            "lap_time": 95.234 + random.uniform(-0.5, 0.5),  # seconds
+            "lap_time": 95.234 + lap_n,  # seconds
             "best_lap_time": 94.123,  # Static best time
             "current_lap": 5,
             "position": 3,
@@ -131,6 +319,16 @@ class AssettoCorsaReader(TelemetryReader):
             "_is_mock": True,  # Flag to indicate this is mock data
         }
 
+    def _swap_noise(self) -> None:
+        """Switch to the pre-generated noise table and start building the next"""
+        if self._noise_next is not None:
+            self._noise, self._noise_next = self._noise_next, None
+        threading.Thread(target=self._refill_noise, daemon=True).start()
+
+    def _refill_noise(self) -> None:
+        """Generate the next noise table off the read path"""
+        self._noise_next = _make_noise_table()
+
     def is_connected(self) -> bool:
         """
         Check if connected to Assetto Corsa
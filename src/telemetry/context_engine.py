@@ -1,13 +1,139 @@
 """Context engine for processing and analyzing telemetry data"""
 
-from typing import Dict, Any, Optional, List
-from collections import deque
+import math
+from array import array
+from typing import Dict, Any, Optional, Tuple
 import time
 
+try:
+    import numpy as np
+except ImportError:  # Optional: array.array buffers (C values, no vector ops)
+    np = None
+
+from ._jit import analyze
+
+
+# Telemetry fields kept in the history ring buffer. No telemetry dict is
+# retained; the current sample is rebuilt from its slot. Float fields store
+# missing values as NaN (typed back on rebuild), int fields as _NO_INT. Types
+# are array/NumPy typecodes ("f" float32, "i" int32, "d" float64, "b" int8).
+_FLOAT_FIELDS = (
+    ("speed", float),
+    ("rpm", int),
+    ("fuel", float),
+    ("lap_time", float),
+)
+_INT_FIELDS = ("gear", "current_lap", "position")
+_NO_INT = -(2 ** 31)
+# Tire temperature key -> ring buffer field
+_TIRE_FIELDS = (
+    ("front_left", "tire_fl"),
+    ("front_right", "tire_fr"),
+    ("rear_left", "tire_rl"),
+    ("rear_right", "tire_rr"),
+)
+# The float32 fields share one (history_size, F) array, a row per sample, so
+# deltas between two samples are a single vector subtraction
+_ROW_FIELDS = (
+    *(name for name, _ in _FLOAT_FIELDS),
+    *(field for _, field in _TIRE_FIELDS),
+    "tire_avg",
+)
+_ROW_COLUMNS = {name: column for column, name in enumerate(_ROW_FIELDS)}
+# The remaining fields get a plain array each
+_RING_FIELDS = (
+    *((name, "i") for name in _INT_FIELDS),
+    ("timestamp", "d"),
+    ("mock", "b"),
+)
+# Fields reported by get_detailed_context()["deltas"]: (key, row column, type)
+_DELTA_FIELDS = tuple(
+    (name, _ROW_COLUMNS[name], cast)
+    for name, cast in _FLOAT_FIELDS
+    if name in ("speed", "fuel", "rpm")
+)
+
+
+# Summary sections in output order: (presence bit, %-format of named values).
+# update() records which sections have data as a bitmask, and each mask maps
+# to one pre-joined template, so a summary is a single format call.
+_HAS_SPEED = 1 << 0
+_HAS_GEAR = 1 << 1
+_HAS_RPM = 1 << 2
+_HAS_LAP_TIME = 1 << 3
+_HAS_BEST_LAP = 1 << 4
+_HAS_DELTA = 1 << 5
+_HAS_FUEL = 1 << 6
+_HAS_TIRES = 1 << 7
+_HAS_POSITION = 1 << 8
+_SUMMARY_SECTIONS = (
+    (_HAS_SPEED, "Speed: %(speed).1f km/h"),
+    (_HAS_GEAR, "Gear: %(gear)s"),
+    (_HAS_RPM, "RPM: %(rpm)s"),
+    (_HAS_LAP_TIME, "Current lap time: %(lap_time).2fs"),
+    (_HAS_BEST_LAP, "Best lap time: %(best_lap_time).2fs"),
+    (_HAS_DELTA, "Delta: %(delta)+.2fs"),
+    (_HAS_FUEL, "Fuel: %(fuel).1fL"),
+    (_HAS_TIRES, "Avg tire temp: %(tire_avg).1f°C"),
+    (_HAS_POSITION, "Position: P%(position)s"),
+)
+# Sections shown whenever the telemetry value is not None
+_PRESENCE_KEYS = (
+    (_HAS_SPEED, "speed"),
+    (_HAS_GEAR, "gear"),
+    (_HAS_RPM, "rpm"),
+    (_HAS_FUEL, "fuel"),
+    (_HAS_POSITION, "position"),
+)
+_SUMMARY_TEMPLATES: Dict[int, str] = {}
+# Float fields in the summary and the decimals they are printed with; the
+# summary is reused while these (rounded) and the int fields are unchanged
+_SUMMARY_PRECISION = (
+    ("speed", 1),
+    ("rpm", 0),
+    ("lap_time", 2),
+    ("fuel", 1),
+    ("tire_avg", 1),
+)
+
+
+def _summary_template(mask: int) -> str:
+    """Return the summary template for a section bitmask (built once per mask)"""
+    template = _SUMMARY_TEMPLATES.get(mask)
+    if template is None:
+        template = ". ".join(fmt for bit, fmt in _SUMMARY_SECTIONS if mask & bit) + "."
+        _SUMMARY_TEMPLATES[mask] = template
+    return template
+
+
+def _rounded(value: float, digits: int) -> Optional[float]:
+    """Round a ring buffer value for the summary fingerprint (None when NaN)"""
+    return None if math.isnan(value) else round(float(value), digits)
+
+
+def _value(telemetry: Dict[str, Any], key: str) -> float:
+    """Return a telemetry value for the ring buffer (NaN when missing)"""
+    value = telemetry.get(key)
+    return math.nan if value is None else value
+
 
 class ContextEngine:
     """Processes telemetry data and generates context for AI"""
 
+    __slots__ = (
+        "history_size",
+        "_rows",
+        "_buf",
+        "_idx",
+        "_count",
+        "best_lap_time",
+        "current_lap_start_time",
+        "last_lap_time",
+        "_last_lap",
+        "_snapshot",
+        "_summary",
+    )
+
     def __init__(self, history_size: int = 10):
         """
         Initialize context engine
@@ -16,15 +142,47 @@ class ContextEngine:
             history_size: Number of telemetry samples to keep in history
         """
         self.history_size = history_size
-        self.telemetry_history: deque = deque(maxlen=history_size)
+        # Ring buffer; slot _idx is written next. _buf maps every field to its
+        # per-sample array (with NumPy, float32 fields are column views of
+        # _rows; without it, every field is an array.array).
+        self._buf: Dict[str, Any]
+        if np is not None:
+            self._rows = np.zeros((history_size, len(_ROW_FIELDS)), dtype=np.float32)
+            self._buf = {name: self._rows[:, column] for name, column in _ROW_COLUMNS.items()}
+            for name, typecode in _RING_FIELDS:
+                self._buf[name] = np.zeros(history_size, dtype=typecode)
+        else:
+            self._rows = None
+            self._buf = {name: array("f", [0]) * history_size for name in _ROW_FIELDS}
+            for name, typecode in _RING_FIELDS:
+                self._buf[name] = array(typecode, [0]) * history_size
+        self._idx = 0
+        self._count = 0
+        # Compile (or load from the on-disk cache) the analysis kernel now
+        # rather than on the first telemetry frame
+        analyze(self._buf["fuel"], self._buf["tire_avg"], self._buf["timestamp"], 0, 0)
         self.best_lap_time: Optional[float] = None
         self.current_lap_start_time: Optional[float] = None
         self.last_lap_time: Optional[float] = None
+        self._last_lap: Optional[int] = None
+        # Lock-free handoff: the polling thread is the only writer and publishes
+        # a (best_lap_time, next slot, sample count, summary section mask)
+        # snapshot with a single reference store (atomic under the GIL);
+        # readers never block it. Readers only look at slots before the
+        # published one, which the writer won't touch again until the ring
+        # wraps around.
+        self._snapshot: Tuple[Optional[float], int, int, int] = (None, 0, 0, 0)
+        # Last summary as (fingerprint, text), replaced as one tuple so
+        # concurrent readers never pair a fingerprint with another's text
+        self._summary: Tuple[Optional[tuple], str] = (None, "")
 
     def update(self, telemetry: Dict[str, Any]) -> None:
         """
         Update context with new telemetry data
 
+        Only the fields in the ring buffer are kept; the dictionary itself
+        is not retained.
+
         Args:
             telemetry: Current telemetry data dictionary
         """
@@ -36,20 +194,52 @@ class ContextEngine:
             telemetry["timestamp"] = time.time()
 
         # Update best lap time
-        if "best_lap_time" in telemetry and telemetry["best_lap_time"]:
-            if self.best_lap_time is None or telemetry["best_lap_time"] < self.best_lap_time:
-                self.best_lap_time = telemetry["best_lap_time"]
+        best_lap_time = telemetry.get("best_lap_time")
+        if best_lap_time and (self.best_lap_time is None or best_lap_time < self.best_lap_time):
+            self.best_lap_time = best_lap_time
 
         # Track lap changes
-        if "current_lap" in telemetry:
-            current_lap = telemetry["current_lap"]
-            if hasattr(self, "_last_lap") and current_lap != self._last_lap:
+        lap = telemetry.get("current_lap")
+        if lap is not None:
+            if self._last_lap is not None and lap != self._last_lap:
                 # New lap started
-                self.current_lap_start_time = telemetry.get("timestamp")
-            self._last_lap = current_lap
+                self.current_lap_start_time = telemetry["timestamp"]
+            self._last_lap = lap
+
+        # Write the fields into the ring; the tire average is reduced once
+        # here so summaries and trend analysis never touch the tire values
+        buf = self._buf
+        idx = self._idx
+        for key, _ in _FLOAT_FIELDS:
+            buf[key][idx] = _value(telemetry, key)
+        for key in _INT_FIELDS:
+            value = telemetry.get(key)
+            buf[key][idx] = _NO_INT if value is None else value
+        temps = telemetry.get("tire_temperatures")
+        for key, field in _TIRE_FIELDS:
+            buf[field][idx] = _value(temps, key) if temps else math.nan
+        buf["tire_avg"][idx] = sum(temps.values()) / len(temps) if temps else math.nan
+        buf["timestamp"][idx] = telemetry["timestamp"]
+        buf["mock"][idx] = bool(telemetry.get("_is_mock"))
+        self._idx = (idx + 1) % self.history_size
+        self._count = min(self._count + 1, self.history_size)
+
+        # Record which summary sections this sample can fill
+        mask = 0
+        for bit, key in _PRESENCE_KEYS:
+            if telemetry.get(key) is not None:
+                mask |= bit
+        if temps:
+            mask |= _HAS_TIRES
+        if telemetry.get("lap_time"):
+            mask |= _HAS_LAP_TIME
+        if self.best_lap_time:
+            mask |= _HAS_BEST_LAP
+            if mask & _HAS_LAP_TIME:
+                mask |= _HAS_DELTA
 
-        # Add to history
-        self.telemetry_history.append(telemetry.copy())
+        # Publish for readers
+        self._snapshot = (self.best_lap_time, self._idx, self._count, mask)
 
     def get_context_summary(self) -> str:
         """
@@ -58,48 +248,35 @@ class ContextEngine:
         Returns:
             String summary of current race state
         """
-        if not self.telemetry_history:
+        best_lap_time, idx, count, mask = self._snapshot
+        if not count:
             return "No telemetry data available."
 
-        current = self.telemetry_history[-1]
-
-        summary_parts = []
-
-        # Speed and gear
-        if "speed" in current:
-            summary_parts.append(f"Speed: {current['speed']:.1f} km/h")
-        if "gear" in current:
-            summary_parts.append(f"Gear: {current['gear']}")
-        if "rpm" in current:
-            summary_parts.append(f"RPM: {current['rpm']}")
-
-        # Lap information
-        if "lap_time" in current and current["lap_time"]:
-            summary_parts.append(f"Current lap time: {current['lap_time']:.2f}s")
-        if self.best_lap_time:
-            summary_parts.append(f"Best lap time: {self.best_lap_time:.2f}s")
-            if "lap_time" in current and current["lap_time"]:
-                delta = current["lap_time"] - self.best_lap_time
-                if delta > 0:
-                    summary_parts.append(f"Delta: +{delta:.2f}s")
-                else:
-                    summary_parts.append(f"Delta: {delta:.2f}s")
-
-        # Fuel
-        if "fuel" in current:
-            summary_parts.append(f"Fuel: {current['fuel']:.1f}L")
-
-        # Tire temperatures
-        if "tire_temperatures" in current:
-            temps = current["tire_temperatures"]
-            avg_temp = sum(temps.values()) / len(temps) if temps else 0
-            summary_parts.append(f"Avg tire temp: {avg_temp:.1f}°C")
-
-        # Position
-        if "position" in current:
-            summary_parts.append(f"Position: P{current['position']}")
-
-        return ". ".join(summary_parts) + "."
+        # Fingerprint at the printed precision, so jitter below it keeps the
+        # cached text
+        buf = self._buf
+        slot = idx - 1
+        key = (
+            mask,
+            best_lap_time,
+            int(buf["gear"][slot]),
+            int(buf["position"][slot]),
+            *(_rounded(buf[name][slot], digits) for name, digits in _SUMMARY_PRECISION),
+        )
+        cached_key, cached_text = self._summary
+        if key == cached_key:
+            return cached_text
+
+        # The template only references the sections present in mask
+        current = self._sample(slot)
+        text = _summary_template(mask) % {
+            **current,
+            "best_lap_time": best_lap_time,
+            "delta": current["lap_time"] - best_lap_time if mask & _HAS_DELTA else None,
+            "tire_avg": buf["tire_avg"][slot],
+        }
+        self._summary = (key, text)
+        return text
 
     def get_detailed_context(self) -> Dict[str, Any]:
         """
@@ -108,70 +285,86 @@ class ContextEngine:
         Returns:
             Dictionary with detailed telemetry context
         """
-        if not self.telemetry_history:
+        # Read the published snapshot once; the polling thread may publish a
+        # newer one meanwhile without affecting this call
+        best_lap_time, idx, count, _ = self._snapshot
+        if not count:
             return {}
 
-        current = self.telemetry_history[-1]
         context = {
-            "current": current,
-            "best_lap_time": self.best_lap_time,
-            "history_size": len(self.telemetry_history),
+            "current": self._sample(idx - 1),
+            "best_lap_time": best_lap_time,
+            "history_size": count,
         }
 
         # Calculate deltas if we have history
-        if len(self.telemetry_history) > 1:
-            previous = self.telemetry_history[-2]
-            context["deltas"] = self._calculate_deltas(previous, current)
+        if count > 1:
+            context["deltas"] = self._calculate_deltas(idx - 2, idx - 1)
 
         # Performance analysis
-        context["analysis"] = self._analyze_performance()
+        context["analysis"] = self._analyze_performance(idx, count)
 
         return context
 
-    def _calculate_deltas(self, previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate deltas between two telemetry samples"""
-        deltas = {}
-
-        if "speed" in previous and "speed" in current:
-            deltas["speed"] = current["speed"] - previous["speed"]
-
-        if "fuel" in previous and "fuel" in current:
-            deltas["fuel"] = current["fuel"] - previous["fuel"]
-
-        if "rpm" in previous and "rpm" in current:
-            deltas["rpm"] = current["rpm"] - previous["rpm"]
+    def _sample(self, slot: int) -> Dict[str, Any]:
+        """
+        Rebuild the telemetry dictionary stored in a ring buffer slot
 
+        Missing fields are left out, so lookups should use .get().
+        """
+        buf = self._buf
+        sample: Dict[str, Any] = {"timestamp": float(buf["timestamp"][slot])}
+        for key, cast in _FLOAT_FIELDS:
+            value = buf[key][slot]
+            if not math.isnan(value):
+                sample[key] = cast(value)
+        for key in _INT_FIELDS:
+            value = int(buf[key][slot])
+            if value != _NO_INT:
+                sample[key] = value
+        temps = {
+            key: float(buf[field][slot])
+            for key, field in _TIRE_FIELDS
+            if not math.isnan(buf[field][slot])
+        }
+        if temps:
+            sample["tire_temperatures"] = temps
+        if buf["mock"][slot]:
+            sample["_is_mock"] = True
+        return sample
+
+    def _calculate_deltas(self, previous: int, current: int) -> Dict[str, Any]:
+        """Calculate deltas between two ring buffer slots"""
+        if self._rows is not None:
+            diff = self._rows[current] - self._rows[previous]
+        else:
+            buf = self._buf
+            diff = [buf[name][current] - buf[name][previous] for name in _ROW_FIELDS]
+
+        # NaN marks a field missing from either sample
+        deltas = {}
+        for key, column, cast in _DELTA_FIELDS:
+            value = diff[column]
+            if not math.isnan(value):
+                deltas[key] = cast(value)
         return deltas
 
-    def _analyze_performance(self) -> Dict[str, Any]:
-        """Analyze performance trends"""
+    def _analyze_performance(self, idx: int, count: int) -> Dict[str, Any]:
+        """Analyze performance trends over the samples before slot idx"""
         analysis = {}
 
-        if len(self.telemetry_history) < 2:
+        if count < 2:
             return analysis
 
-        # Convert deque to list for slicing (deque doesn't support slicing)
-        history_list = list(self.telemetry_history)
-
-        # Check tire temperature trends
-        if len(history_list) >= 3:
-            recent_history = history_list[-3:]
-            if all("tire_temperatures" in t for t in recent_history):
-                recent_temps = [
-                    sum(t["tire_temperatures"].values()) / len(t["tire_temperatures"])
-                    for t in recent_history
-                ]
-                if len(recent_temps) >= 2:
-                    analysis["tire_temp_trend"] = "increasing" if recent_temps[-1] > recent_temps[0] else "decreasing"
-
-        # Check fuel consumption rate
-        if len(history_list) >= 5:
-            fuel_history = history_list[-5:]
-            if all("fuel" in t for t in fuel_history):
-                fuel_samples = [t["fuel"] for t in fuel_history]
-                if len(fuel_samples) >= 2:
-                    fuel_consumption = fuel_samples[0] - fuel_samples[-1]
-                    analysis["fuel_consumption_rate"] = fuel_consumption
+        buf = self._buf
+        rate, _, trend = analyze(buf["fuel"], buf["tire_avg"], buf["timestamp"], idx, count)
 
-        return analysis
+        # Tire temperature trend over the last 3 samples
+        if trend:
+            analysis["tire_temp_trend"] = "increasing" if trend > 0 else "decreasing"
 
+        # Fuel consumption rate (litres per second over the last 5 samples)
+        if not math.isnan(rate):
+            analysis["fuel_consumption_rate"] = float(rate)
+
+        return analysis
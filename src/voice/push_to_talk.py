@@ -1,14 +1,57 @@
 """Push-to-Talk interface for voice input"""
 
+import logging
 import threading
-from typing import Callable, Optional
+from typing import Any, Callable, FrozenSet, Optional
 
-import keyboard
+try:
+    # Preferred: OS-native event listener (no global polling hook, no root on Linux)
+    from pynput import keyboard as pynput_keyboard
+except ImportError:
+    pynput_keyboard = None
+
+logger = logging.getLogger(__name__)
+
+# Key names accepted by the keyboard package that are not pynput Key
+# attributes (after spaces become "_"), mapped to the pynput keys they cover.
+# A bare modifier matches either side, as it does with the keyboard package
+_PYNPUT_ALIASES = {
+    "ctrl": ("ctrl", "ctrl_l", "ctrl_r"),
+    "control": ("ctrl", "ctrl_l", "ctrl_r"),
+    "left_ctrl": ("ctrl_l",),
+    "right_ctrl": ("ctrl_r",),
+    "shift": ("shift", "shift_l", "shift_r"),
+    "left_shift": ("shift", "shift_l"),
+    "right_shift": ("shift_r",),
+    "alt": ("alt", "alt_l", "alt_r", "alt_gr"),
+    "left_alt": ("alt_l",),
+    "right_alt": ("alt_r", "alt_gr"),
+    "windows": ("cmd", "cmd_l", "cmd_r"),
+    "left_windows": ("cmd_l",),
+    "right_windows": ("cmd_r",),
+    "capslock": ("caps_lock",),
+    "escape": ("esc",),
+    "return": ("enter",),
+    "spacebar": ("space",),
+    "del": ("delete",),
+    "pgup": ("page_up",),
+    "pgdown": ("page_down",),
+}
 
 
 class PushToTalk:
     """Manages push-to-talk functionality"""
 
+    __slots__ = (
+        "key",
+        "on_press",
+        "on_release",
+        "is_pressed",
+        "listening",
+        "_listener",
+        "_keys",
+    )
+
     def __init__(
         self,
         key: str = "SPACE",
@@ -28,6 +71,32 @@ class PushToTalk:
         self.on_release = on_release
         self.is_pressed = False
         self.listening = False
+        # pynput listener and the key objects events are compared against,
+        # resolved once so each event is a single set lookup (None: use the
+        # keyboard package)
+        self._listener: Optional[Any] = None
+        self._keys: Optional[FrozenSet[Any]] = None
+        if pynput_keyboard is not None:
+            self._keys = self._resolve_pynput_keys(self.key)
+            if self._keys is None:
+                logger.warning("Unknown push-to-talk key %r for pynput, using the keyboard package", key)
+
+    @staticmethod
+    def _resolve_pynput_keys(name: str) -> Optional[FrozenSet[Any]]:
+        """
+        Map a key name ("space", "f1", "left ctrl", "t") to pynput key objects
+
+        Returns:
+            The keys that count as a press, or None if the name is unknown
+        """
+        name = "_".join(name.split())
+        keys = [getattr(pynput_keyboard.Key, alias, None) for alias in _PYNPUT_ALIASES.get(name, (name,))]
+        keys = frozenset(key for key in keys if key is not None)
+        if keys:
+            return keys
+        if len(name) == 1:
+            return frozenset((pynput_keyboard.KeyCode.from_char(name),))
+        return None
 
     def start(self) -> None:
         """Start listening for push-to-talk key"""
@@ -35,24 +104,59 @@ class PushToTalk:
             return
 
         self.listening = True
+        if self._keys is not None:
+            self._listener = pynput_keyboard.Listener(
+                on_press=self._on_pynput_press,
+                on_release=self._on_pynput_release,
+            )
+            self._listener.start()
+            return
+
+        # Fallback: the keyboard package
+        import keyboard
+
         keyboard.on_press_key(self.key, self._on_key_press)
         keyboard.on_release_key(self.key, self._on_key_release)
 
     def stop(self) -> None:
         """Stop listening for push-to-talk key"""
         self.listening = False
-        keyboard.unhook_all()
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            return
 
+        if self._keys is None:
+            import keyboard
+
+            keyboard.unhook_all()
+
+    def _on_pynput_press(self, key: Any) -> None:
+        """Handle pynput key press event"""
+        if key in self._keys and not self.is_pressed:
+            self.is_pressed = True
+            if self.on_press:
+                self.on_press()
+
+    def _on_pynput_release(self, key: Any) -> None:
+        """Handle pynput key release event"""
+        if key in self._keys and self.is_pressed:
+            self.is_pressed = False
+            if self.on_release:
+                self.on_release()
+
+    # The keyboard hooks are registered for self.key only, so events need no
+    # key name check
     def _on_key_press(self, event) -> None:
         """Handle key press event"""
-        if event.name.lower() == self.key and not self.is_pressed:
+        if not self.is_pressed:
             self.is_pressed = True
             if self.on_press:
                 self.on_press()
 
     def _on_key_release(self, event) -> None:
         """Handle key release event"""
-        if event.name.lower() == self.key and self.is_pressed:
+        if self.is_pressed:
             self.is_pressed = False
             if self.on_release:
                 self.on_release()
@@ -65,4 +169,3 @@ class PushToTalk:
             True if key is currently pressed, False otherwise
         """
         return self.is_pressed
-
@@ -1,25 +1,268 @@
 """Voice handler for STT and TTS"""
 
+import hashlib
 import logging
+import os
 import queue
 import threading
 import time
-from typing import Callable, Optional
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    # Preferred: callback capture on PortAudio's own thread (no Python read loop)
+    import sounddevice as sd
+except (ImportError, OSError):  # OSError: PortAudio library not found
+    sd = None
+
+try:
+    # Optional: in-process MP3 decoding for TTS playback (no player process)
+    import miniaudio
+except ImportError:
+    miniaudio = None
+
+try:
+    # Optional: speech detection before Whisper (skips noise-only recordings)
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
 
 from .push_to_talk import PushToTalk
 
 logger = logging.getLogger(__name__)
 
+# Microphone capture format (16 kHz mono int16, what Whisper expects)
+_CHANNELS = 1
+_RATE = 16000
+# Longest utterance kept per push-to-talk press
+_MAX_RECORD_SECONDS = 30
+# int16 PCM -> [-1.0, 1.0) float; a power of two, so exact in float32
+_INT16_SCALE = 1.0 / 32768.0
+# Recordings quieter than this RMS level (int16 scale) are treated as silence
+_SILENCE_RMS = 300
+# WebRTC VAD: 30 ms frames, most aggressive mode, and the share of voiced
+# frames below which a recording is treated as noise
+_VAD_FRAME_SAMPLES = _RATE * 30 // 1000
+_VAD_MODE = 3
+_VAD_MIN_VOICED = 0.2
+# Recordings waiting for transcription; beyond this the oldest is dropped
+_AUDIO_QUEUE_SIZE = 4
+
+# Language code -> word identifying a pyttsx3 (system) voice by name
+_PYTTSX3_VOICE_NAMES = {"es": "spanish", "en": "english", "fr": "french"}
+
+# Synthesized edge-tts phrases, reused for repeated (voice, text) pairs; the
+# least recently played files beyond the limit are removed
+_TTS_CACHE_DIR = Path.home() / ".apex_cache" / "tts"
+_TTS_CACHE_MAX_FILES = 200
+# edge-tts output format (24 kHz mono), used for the playback stream
+_TTS_RATE = 24000
+
+# Language code -> edge-tts voice (neural voices sound natural)
+_EDGE_TTS_VOICES = {
+    "es": "es-ES-ElviraNeural",  # Natural Spanish female voice
+    "en": "en-US-AriaNeural",  # Natural English female voice
+    "fr": "fr-FR-DeniseNeural",  # Natural French female voice
+}
+
+
+# Windows THREAD_PRIORITY_TIME_CRITICAL and the Linux SCHED_FIFO priority for
+# the PyAudio recording thread
+_WIN_THREAD_PRIORITY_TIME_CRITICAL = 15
+_LINUX_FIFO_PRIORITY = 20
+
+# Speech-to-text backends: "auto" tries faster-whisper, then openai-whisper
+_STT_BACKENDS = ("auto", "faster-whisper", "whisper")
+
+# faster-whisper compute types by device, best first: int8 weights (half the
+# memory traffic) with FP16 compute on GPUs with INT8 tensor cores, FP16 on
+# other tensor-core GPUs, then whatever the device still supports
+_COMPUTE_TYPES = {
+    "cuda": ("int8_float16", "float16", "int8", "float32"),
+    "cpu": ("int8", "float32"),
+}
+
+# Loaded Whisper models by (name, requested backend): (model, backend name, device)
+_WHISPER_MODELS: Dict[Tuple[str, str], Tuple[Any, str, str]] = {}
+_WHISPER_LOCK = threading.Lock()
+
+
+def _raise_thread_priority() -> None:
+    """
+    Give the calling thread real-time scheduling priority (best effort)
+
+    Needs CAP_SYS_NICE (or an rtprio limit) on Linux; without it, or on other
+    platforms, the thread keeps its normal priority.
+    """
+    try:
+        if os.name == "nt":
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _WIN_THREAD_PRIORITY_TIME_CRITICAL)
+        elif hasattr(os, "sched_setscheduler"):
+            # On Linux, pid 0 is the calling thread
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(_LINUX_FIFO_PRIORITY))
+    except (OSError, AttributeError) as e:
+        logger.debug("Could not raise recording thread priority: %s", e)
+
+
+def _best_compute_type(device: str) -> str:
+    """Return the fastest faster-whisper compute type CTranslate2 supports on a device"""
+    import ctranslate2
+
+    # CTranslate2 only lists the types the detected hardware runs natively
+    supported = ctranslate2.get_supported_compute_types(device)
+    for compute_type in _COMPUTE_TYPES[device]:
+        if compute_type in supported:
+            return compute_type
+    return "float32"
+
+
+def _load_whisper_model(name: str, backend: str = "auto") -> Tuple[Any, str, str]:
+    """
+    Load a Whisper model
+
+    faster-whisper (CTranslate2) is preferred unless backend is "whisper";
+    openai-whisper is the fallback. A CUDA GPU is used when available,
+    otherwise the CPU; faster-whisper uses the best compute type the device
+    supports (see _best_compute_type).
+
+    Args:
+        name: Model name (e.g. "tiny.en", "base")
+        backend: One of _STT_BACKENDS
+
+    Returns:
+        (model, backend name, device)
+    """
+    if backend != "whisper":
+        try:
+            import ctranslate2
+            from faster_whisper import WhisperModel
+
+            if ctranslate2.get_cuda_device_count() > 0:
+                model = WhisperModel(name, device="cuda", compute_type=_best_compute_type("cuda"), num_workers=1)
+                return model, "faster-whisper", "cuda"
+            model = WhisperModel(
+                name,
+                device="cpu",
+                compute_type=_best_compute_type("cpu"),
+                cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+                num_workers=1,
+            )
+            return model, "faster-whisper", "cpu"
+        except ImportError:
+            log = logger.warning if backend == "faster-whisper" else logger.debug
+            log("faster-whisper not installed, using openai-whisper")
+
+    import torch
+    import whisper
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    return whisper.load_model(name, device=device), "whisper", device
+
+
+def _get_whisper_model(name: str, backend: str = "auto") -> Tuple[Any, str, str]:
+    """
+    Return the process-wide Whisper model for a name and backend, loading it
+    on first use
+
+    Every VoiceHandler shares it, so the weights are read (and copied to the
+    GPU) once per process.
+
+    Returns:
+        (model, backend name, device)
+    """
+    key = (name, backend)
+    loaded = _WHISPER_MODELS.get(key)
+    if loaded is None:
+        with _WHISPER_LOCK:
+            loaded = _WHISPER_MODELS.get(key)
+            if loaded is None:
+                logger.info("Loading Whisper model %s (first time, this may take a moment)...", name)
+                load_start = time.perf_counter()
+                loaded = _load_whisper_model(name, backend)
+                _WHISPER_MODELS[key] = loaded
+                logger.info(
+                    "Whisper model loaded in %.2fs (%s on %s)", time.perf_counter() - load_start, loaded[1], loaded[2]
+                )
+    return loaded
+
+
+if miniaudio is not None:
+
+    class _QueuedMP3(miniaudio.StreamableSource):
+        """MP3 bytes arriving on a queue (None = end), read by miniaudio's decoder"""
+
+        def __init__(self, chunks: queue.Queue):
+            self._chunks = chunks
+            self._pending = memoryview(b"")
+            self._ended = False
+            # Everything received, for the phrase cache
+            self.data = bytearray()
+
+        def read(self, num_bytes: int) -> bytes:
+            # Returns what has arrived (up to num_bytes), blocking only when
+            # nothing is buffered; b"" tells the decoder the stream ended
+            if not self._pending and not self._ended:
+                chunk = self._chunks.get()
+                if chunk is None:
+                    self._ended = True
+                else:
+                    self.data += chunk
+                    self._pending = memoryview(chunk)
+            data, self._pending = self._pending[:num_bytes], self._pending[num_bytes:]
+            return bytes(data)
+
 
 class VoiceHandler:
     """Handles speech-to-text and text-to-speech"""
 
+    __slots__ = (
+        "stt_enabled",
+        "tts_enabled",
+        "microphone_index",
+        "whisper_model",
+        "stt_backend",
+        "audio_blocksize",
+        "audio_latency",
+        "_chunk",
+        "is_recording",
+        "audio_queue",
+        "_audio_ready",
+        "audio_thread",
+        "_worker",
+        "_pa",
+        "_stream",
+        "_samples",
+        "_cursor",
+        "_whisper_model",
+        "_whisper_backend",
+        "_whisper_device",
+        "_pinned",
+        "_copy_stream",
+        "_tts_queue",
+        "_tts_thread",
+        "_tts_engine",
+        "_player",
+        "_tts_voices",
+        "_tts_voice",
+        "ptt",
+        "on_transcription",
+    )
+
     def __init__(
         self,
         stt_enabled: bool = True,
         tts_enabled: bool = False,
         push_to_talk_key: str = "SPACE",
         microphone_index: Optional[int] = None,
+        whisper_model: str = "tiny.en",
+        stt_backend: str = "auto",
+        audio_blocksize: int = 0,
+        audio_latency: Union[str, float] = "low",
+        chunk_ms: int = 64,
     ):
         """
         Initialize voice handler
@@ -29,18 +272,68 @@ class VoiceHandler:
             tts_enabled: Enable text-to-speech
             push_to_talk_key: Key for push-to-talk
             microphone_index: Optional microphone device index
+            whisper_model: Whisper model name (English-only "tiny.en" by
+                default, as queries are transcribed as English)
+            stt_backend: "auto" (faster-whisper, else openai-whisper),
+                "faster-whisper" or "whisper"
+            audio_blocksize: Frames per sounddevice callback (0 = whatever
+                the host API handles best)
+            audio_latency: sounddevice input latency ("low", "high" or
+                seconds)
+            chunk_ms: PyAudio fallback read size in milliseconds (smaller
+                means lower latency, more wake-ups)
         """
         self.stt_enabled = stt_enabled
         self.tts_enabled = tts_enabled
         self.microphone_index = microphone_index
+        self.whisper_model = whisper_model
+        if stt_backend not in _STT_BACKENDS:
+            logger.warning("Unknown STT backend %r, using auto", stt_backend)
+            stt_backend = "auto"
+        self.stt_backend = stt_backend
+        self.audio_blocksize = audio_blocksize
+        self.audio_latency = audio_latency
+        self._chunk = max(1, _RATE * chunk_ms // 1000)
 
         # Audio recording
         self.is_recording = False
-        self.audio_queue = queue.Queue()
+        # Recordings for the transcription worker. One producer and one
+        # consumer, so a deque (appends and pops are atomic) plus an Event
+        # replace a locked queue; maxlen drops the oldest when full
+        self.audio_queue: deque = deque(maxlen=_AUDIO_QUEUE_SIZE)
+        self._audio_ready = threading.Event()
         self.audio_thread: Optional[threading.Thread] = None
+        # Transcription worker (one thread, so utterances are handled in order)
+        self._worker: Optional[threading.Thread] = None
+        # Input stream (sounddevice, or PyAudio with its PortAudio instance),
+        # opened on first use and kept (stopped between presses) until stop()
+        self._pa = None
+        self._stream = None
+        # sounddevice recording: int16 samples of the current press and the
+        # number written so far (filled by the stream callback)
+        self._samples = None
+        self._cursor = 0
         
-        # Whisper model (lazy loaded)
+        # Shared Whisper model (fetched on first transcription), the library
+        # providing it and its device
         self._whisper_model = None
+        self._whisper_backend: Optional[str] = None
+        self._whisper_device = "cpu"
+        # openai-whisper on CUDA: page-locked staging buffer for the samples
+        # and the stream their host-to-device copy runs on (created on first use)
+        self._pinned = None
+        self._copy_stream = None
+
+        # TTS playback queue (one worker so streamed sentences play in order)
+        self._tts_queue: queue.Queue = queue.Queue()
+        self._tts_thread: Optional[threading.Thread] = None
+        # TTS output stream, opened once by the TTS worker thread
+        self._player = None
+        # pyttsx3 engine, created once by the TTS worker thread, with the
+        # voice id per language (found once) and the voice currently set
+        self._tts_engine = None
+        self._tts_voices: Dict[str, str] = {}
+        self._tts_voice: Optional[str] = None
 
         # Push-to-talk
         self.ptt = PushToTalk(
@@ -54,6 +347,16 @@ class VoiceHandler:
 
     def start(self) -> None:
         """Start voice handler"""
+        if self.stt_enabled:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._transcription_loop, daemon=True)
+                self._worker.start()
+            # Open the microphone now so a press only starts the stream (device
+            # probing stays off the push-to-talk path); retried on first press
+            try:
+                self._ensure_stream()
+            except Exception as e:
+                logger.warning("Could not open microphone: %s", e)
         self.ptt.start()
 
     def stop(self) -> None:
@@ -61,8 +364,16 @@ class VoiceHandler:
         self.ptt.stop()
         if self.is_recording:
             self._stop_recording()
-        # Clean up whisper model
-        self._whisper_model = None
+        # The whisper model stays loaded (on the GPU, if used): reloading it
+        # costs seconds
+        self._close_stream()
+        # Stop transcription worker
+        if self._worker and self._worker.is_alive():
+            self._enqueue_audio(None)
+            self._worker.join(timeout=1.0)
+        # Stop TTS worker
+        if self._tts_thread and self._tts_thread.is_alive():
+            self._tts_queue.put(None)
 
     def _start_recording(self) -> None:
         """Start recording audio"""
@@ -72,7 +383,22 @@ class VoiceHandler:
 
         logger.info("Starting audio recording...")
         self.is_recording = True
-        # Start recording thread
+        if sd is not None:
+            try:
+                import numpy as np
+
+                stream = self._ensure_stream()
+                # A fresh array per press, as the previous one may still be
+                # in transcription
+                self._samples = np.empty(_MAX_RECORD_SECONDS * _RATE * _CHANNELS, dtype=np.int16)
+                self._cursor = 0
+                stream.start()
+            except Exception as e:
+                logger.error("Error starting audio stream: %s", e)
+                self.is_recording = False
+            return
+
+        # PyAudio fallback: blocking reads on a recording thread
         self.audio_thread = threading.Thread(target=self._record_audio, daemon=True)
         self.audio_thread.start()
         logger.debug("Recording thread started")
@@ -86,193 +412,427 @@ class VoiceHandler:
         logger.info("Stopping audio recording...")
         self.is_recording = False
 
+        if sd is not None:
+            try:
+                # Returns once pending callbacks have run
+                self._stream.stop()
+            except Exception as e:
+                logger.error("Error stopping audio stream: %s", e)
+            if self._cursor >= len(self._samples):
+                logger.warning("Recording reached the %ds limit, ignoring the rest", _MAX_RECORD_SECONDS)
+            # Hand off to the transcription worker (zero-copy slice of the
+            # recorded part)
+            self._enqueue_audio(self._samples[: self._cursor])
+            self._samples = None
+            return
+
         if self.audio_thread and self.audio_thread.is_alive():
             logger.debug("Waiting for recording thread to finish...")
             self.audio_thread.join(timeout=1.0)
             if self.audio_thread.is_alive():
                 logger.warning("Recording thread did not finish within timeout")
 
-        # Process recorded audio in a separate thread to avoid blocking
-        if self.stt_enabled:
-            logger.debug("Starting audio processing in background thread...")
-            processing_thread = threading.Thread(target=self._process_audio, daemon=True)
-            processing_thread.start()
+    def _on_audio_block(self, indata, frames: int, time_info, status) -> None:
+        """sounddevice callback: append one block to the current recording"""
+        start = self._cursor
+        end = min(start + frames, len(self._samples))
+        self._samples[start:end] = indata[: end - start, 0]
+        self._cursor = end
 
     def _record_audio(self) -> None:
-        """Record audio in a separate thread"""
+        """Record audio in a separate thread (PyAudio fallback)"""
+        # Fewer preemptions while the rest of the app runs Python code, so
+        # fewer dropped chunks (sounddevice callbacks already run on
+        # PortAudio's own high-priority thread)
+        _raise_thread_priority()
         try:
-            import pyaudio
+            import numpy as np
 
-            CHUNK = 1024
-            FORMAT = pyaudio.paInt16
-            CHANNELS = 1
-            RATE = 16000
+            stream = self._ensure_stream()
+            stream.start_stream()
 
-            audio = pyaudio.PyAudio()
-            stream = audio.open(
-                format=FORMAT,
-                channels=CHANNELS,
-                rate=RATE,
-                input=True,
-                input_device_index=self.microphone_index,
-                frames_per_buffer=CHUNK,
-            )
-
-            frames = []
+            # Chunks are copied straight into one preallocated int16 array
+            # through a byte view of it (no list of chunks and no final join).
+            # A fresh array per press, as the previous one may still be in
+            # transcription.
+            samples = np.empty(_MAX_RECORD_SECONDS * _RATE * _CHANNELS, dtype=np.int16)
+            view = memoryview(samples).cast("B")
+            offset = 0
 
             while self.is_recording:
-                data = stream.read(CHUNK, exception_on_overflow=False)
-                frames.append(data)
+                data = stream.read(self._chunk, exception_on_overflow=False)
+                end = offset + len(data)
+                if end > len(view):
+                    logger.warning("Recording reached the %ds limit, ignoring the rest", _MAX_RECORD_SECONDS)
+                    break
+                view[offset:end] = data
+                offset = end
 
             stream.stop_stream()
-            stream.close()
-            audio.terminate()
 
-            # Store audio data
-            self.audio_queue.put(b"".join(frames))
+            # Hand off to the transcription worker (zero-copy slice of the
+            # recorded part)
+            self._enqueue_audio(samples[: offset // 2])
 
         except ImportError:
             print("pyaudio not installed. Install with: pip install pyaudio")
         except Exception as e:
             print(f"Error recording audio: {e}")
 
-    def _process_audio(self) -> None:
-        """Process recorded audio with STT"""
+    def _ensure_stream(self):
+        """Open the microphone stream once (stopped) and return it"""
+        if self._stream is None and sd is not None:
+            self._stream = sd.InputStream(
+                samplerate=_RATE,
+                channels=_CHANNELS,
+                dtype="int16",
+                blocksize=self.audio_blocksize,
+                latency=self.audio_latency,
+                device=self.microphone_index,
+                callback=self._on_audio_block,
+            )
+        elif self._stream is None:
+            import pyaudio
+
+            self._pa = pyaudio.PyAudio()
+            self._stream = self._pa.open(
+                format=pyaudio.paInt16,
+                channels=_CHANNELS,
+                rate=_RATE,
+                input=True,
+                input_device_index=self.microphone_index,
+                frames_per_buffer=self._chunk,
+                start=False,
+            )
+        return self._stream
+
+    def _close_stream(self) -> None:
+        """Close the microphone stream and release PortAudio"""
         try:
-            if self.audio_queue.empty():
-                logger.warning("Audio queue is empty, nothing to process")
+            if self._stream is not None:
+                self._stream.close()
+            if self._pa is not None:
+                self._pa.terminate()
+        except Exception as e:
+            logger.debug("Error closing audio stream: %s", e)
+        self._stream = None
+        self._pa = None
+
+    def _enqueue_audio(self, item: Optional[Any]) -> None:
+        """Queue a recording (or the None stop sentinel), dropping the oldest when full"""
+        if len(self.audio_queue) == _AUDIO_QUEUE_SIZE:
+            logger.warning("Transcription queue full, dropped the oldest recording")
+        self.audio_queue.append(item)
+        self._audio_ready.set()
+
+    def _transcription_loop(self) -> None:
+        """
+        Transcription worker loop
+
+        Recordings that queued up while the previous one was transcribed are
+        drained together and transcribed as a batch where the backend allows
+        (see _transcribe_batch); each still gets its own callback, in order.
+        """
+        while True:
+            self._audio_ready.wait()
+            # Cleared before draining, so a recording queued meanwhile sets it
+            # again and is picked up on the next pass
+            self._audio_ready.clear()
+            recordings = []
+            stopping = False
+            while self.audio_queue:
+                audio_data = self.audio_queue.popleft()
+                if audio_data is None:
+                    stopping = True
+                    break
+                recordings.append(audio_data)
+
+            if len(recordings) == 1:
+                self._transcribe_and_dispatch(recordings[0])
+            elif recordings:
+                logger.info("Transcribing %d queued recordings as a batch", len(recordings))
+                self._transcribe_batch(recordings)
+            if stopping:
                 return
 
-            logger.debug("Getting audio data from queue...")
-            audio_data = self.audio_queue.get()
-            logger.debug(f"Audio data retrieved: {len(audio_data)} bytes")
+    def _transcribe_and_dispatch(self, audio_data: Any) -> None:
+        """Transcribe one recording and pass the text to the callback"""
+        try:
+            logger.debug("Audio data retrieved: %d samples", len(audio_data))
 
             # Use whisper or other STT library
             logger.info("Starting audio transcription...")
-            transcribe_start = time.time()
+            transcribe_start = time.perf_counter()
             transcription = self._transcribe_audio(audio_data)
-            transcribe_time = time.time() - transcribe_start
-            
+            transcribe_time = time.perf_counter() - transcribe_start
             if transcription:
-                logger.info(f"Transcription completed in {transcribe_time:.2f}s: {transcription}")
-                if self.on_transcription:
-                    try:
-                        logger.debug("Calling transcription callback...")
-                        self.on_transcription(transcription)
-                    except Exception as callback_error:
-                        logger.error(f"Error in transcription callback: {callback_error}", exc_info=True)
-                        print(f"Error in transcription callback: {callback_error}")
-                        import traceback
-                        traceback.print_exc()
-                else:
-                    logger.warning("No transcription callback registered")
-            else:
-                logger.warning("Transcription returned empty result")
+                logger.info("Transcription completed in %.2fs: %s", transcribe_time, transcription)
+            self._dispatch_transcription(transcription)
 
         except Exception as e:
-            logger.error(f"Error processing audio: {e}", exc_info=True)
+            logger.error("Error processing audio: %s", e, exc_info=True)
             print(f"Error processing audio: {e}")
             import traceback
             traceback.print_exc()
 
-    def _transcribe_audio(self, audio_data: bytes) -> Optional[str]:
+    def _dispatch_transcription(self, transcription: Optional[str]) -> None:
+        """Pass one recording's text to the callback"""
+        if not transcription:
+            logger.warning("Transcription returned empty result")
+            return
+        if self.on_transcription:
+            try:
+                logger.debug("Calling transcription callback...")
+                self.on_transcription(transcription)
+            except Exception as callback_error:
+                logger.error("Error in transcription callback: %s", callback_error, exc_info=True)
+                print(f"Error in transcription callback: {callback_error}")
+                import traceback
+                traceback.print_exc()
+        else:
+            logger.warning("No transcription callback registered")
+
+    def _transcribe_audio(self, audio_data: Any) -> Optional[str]:
         """
         Transcribe audio to text
 
         Args:
-            audio_data: Raw audio bytes
+            audio_data: 16-bit PCM audio, as an int16 array (what the
+                recorder queues) or any bytes-like object
 
         Returns:
             Transcribed text or None
         """
         try:
-            import io
-            import wave
+            audio_array = self._prepare_audio(audio_data)
+            if audio_array is None:
+                return None
+            self._ensure_whisper_model()
+            return self._run_model(audio_array)
+        except ImportError:
+            logger.error("Whisper not installed")
+            print("whisper not installed. Install with: pip install faster-whisper (or openai-whisper)")
+            return None
+        except Exception as e:
+            logger.error("Error transcribing audio: %s", e, exc_info=True)
+            print(f"Error transcribing audio: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
 
-            import numpy as np
-            import whisper
+    def _transcribe_batch(self, recordings: list) -> None:
+        """
+        Transcribe several recordings and pass each text to the callback, in
+        order
 
-            # Check if audio data is empty
-            if not audio_data or len(audio_data) == 0:
-                logger.warning("Audio data is empty")
-                return None
+        openai-whisper decodes them in a single batched model call: a
+        push-to-talk recording never exceeds one 30 s Whisper window, so each
+        is one row of the mel batch. faster-whisper has no API for batching
+        separate audios, so its recordings (and those of a failed batch) go
+        through _transcribe_and_dispatch one after another.
+        """
+        transcriptions = None
+        try:
+            self._ensure_whisper_model()
+            if self._whisper_backend == "whisper":
+                transcriptions = self._decode_recordings(recordings)
+        except Exception as e:
+            logger.warning("Batched transcription failed, transcribing recordings one by one: %s", e)
+
+        if transcriptions is None:
+            for audio_data in recordings:
+                self._transcribe_and_dispatch(audio_data)
+            return
+        for transcription in transcriptions:
+            self._dispatch_transcription(transcription)
+
+    def _decode_recordings(self, recordings: list) -> List[Optional[str]]:
+        """Return one openai-whisper text (or None) per recording, in order"""
+        arrays = [self._prepare_audio(audio_data) for audio_data in recordings]
+        voiced = [audio_array for audio_array in arrays if audio_array is not None]
+        if len(voiced) == 1:
+            texts = iter([self._run_model(voiced[0])])
+        else:
+            texts = iter(self._decode_batch(voiced) if voiced else [])
+        return [None if audio_array is None else next(texts) for audio_array in arrays]
+
+    def _prepare_audio(self, audio_data: Any):
+        """
+        Convert a recording to Whisper's float32 input, or None when it is
+        empty, too short or silent
+        """
+        import numpy as np
 
+        # Check if audio data is empty
+        if audio_data is None or len(audio_data) == 0:
+            logger.warning("Audio data is empty")
+            return None
+
+        # Recordings arrive as int16 arrays already; raw bytes are viewed
+        # as one without copying
+        if isinstance(audio_data, np.ndarray):
+            audio_int16 = audio_data
+        else:
             logger.debug("Converting audio bytes to numpy array...")
-            # Convert raw audio bytes to numpy array
-            # PyAudio records in 16-bit PCM format
-            # Use frombuffer and create a proper copy to avoid view issues
             audio_int16 = np.frombuffer(audio_data, dtype=np.int16)
-            
-            # Ensure audio array is not empty
-            if len(audio_int16) == 0:
-                logger.warning("Audio array is empty after conversion")
-                return None
 
-            # Check minimum audio length (at least 0.5 seconds at 16kHz)
-            min_samples = 8000  # 0.5 seconds at 16kHz
-            if len(audio_int16) < min_samples:
-                logger.warning(f"Audio too short: {len(audio_int16)} samples (minimum: {min_samples})")
+        # Ensure audio array is not empty
+        if len(audio_int16) == 0:
+            logger.warning("Audio array is empty after conversion")
+            return None
+
+        # Check minimum audio length (at least 0.5 seconds at 16kHz)
+        min_samples = 8000  # 0.5 seconds at 16kHz
+        if len(audio_int16) < min_samples:
+            logger.warning("Audio too short: %d samples (minimum: %d)", len(audio_int16), min_samples)
+            return None
+
+        logger.debug("Audio samples: %d, duration: ~%.2fs", len(audio_int16), len(audio_int16)/16000)
+
+        # Skip the model entirely on silence (e.g. an accidental press)
+        rms = int(np.sqrt(np.mean(np.square(audio_int16, dtype=np.int32))))
+        if rms < _SILENCE_RMS:
+            logger.info("Audio below RMS threshold (%d < %d), skipping transcription", rms, _SILENCE_RMS)
+            return None
+        if webrtcvad is not None:
+            voiced = self._voiced_ratio(audio_int16)
+            if voiced < _VAD_MIN_VOICED:
+                logger.info("No speech detected (%.0f%% voiced frames), skipping transcription", voiced * 100)
                 return None
 
-            logger.debug(f"Audio samples: {len(audio_int16)}, duration: ~{len(audio_int16)/16000:.2f}s")
+        # Convert to float32 normalized to [-1.0, 1.0] in a single pass
+        # (dtype forces the float32 loop, with no float64 intermediate).
+        # The result is the 1-D, contiguous, writable array whisper needs
+        return np.multiply(audio_int16, _INT16_SCALE, dtype=np.float32)
 
-            # Convert to float32 and normalize to [-1.0, 1.0]
-            # Create a proper copy (not a view) to ensure compatibility
-            audio_array = (audio_int16.astype(np.float32, copy=True) / 32768.0)
-            
-            # Ensure audio is 1D array (mono)
-            if audio_array.ndim > 1:
-                audio_array = audio_array.flatten()
-            
-            # Make sure array is contiguous and writable (required by whisper)
-            # Use np.array() to ensure it's a standard numpy array, not a view or special type
-            audio_array = np.array(audio_array, dtype=np.float32, copy=True)
-            
-            # Ensure it's contiguous in memory
-            if not audio_array.flags['C_CONTIGUOUS']:
-                audio_array = np.ascontiguousarray(audio_array, dtype=np.float32)
-
-            # Load whisper model (cache it to avoid reloading)
-            if self._whisper_model is None:
-                logger.info("Loading Whisper model (first time, this may take a moment)...")
-                load_start = time.time()
-                self._whisper_model = whisper.load_model("base")
-                load_time = time.time() - load_start
-                logger.info(f"Whisper model loaded in {load_time:.2f}s")
-            else:
-                logger.debug("Using cached Whisper model")
-            
-            # Transcribe - pass the array directly
-            # Use verbose=False to avoid processing segments that might cause issues
-            logger.debug("Running Whisper transcription...")
-            whisper_start = time.time()
-            result = self._whisper_model.transcribe(
-                audio_array, 
+    def _ensure_whisper_model(self) -> None:
+        """Attach the shared Whisper model (loaded once per process)"""
+        if self._whisper_model is None:
+            self._whisper_model, self._whisper_backend, self._whisper_device = _get_whisper_model(
+                self.whisper_model, self.stt_backend
+            )
+
+    def _run_model(self, audio_array) -> Optional[str]:
+        """Transcribe one prepared recording with the loaded model"""
+        if self._whisper_backend == "faster-whisper":
+            logger.debug("Running faster-whisper transcription...")
+            whisper_start = time.perf_counter()
+            # Greedy decoding without timestamp tokens, and VAD skips
+            # silence before the decoder
+            segments, _ = self._whisper_model.transcribe(
+                audio_array,
                 language="en",
-                verbose=False,
-                condition_on_previous_text=False
+                beam_size=1,
+                best_of=1,
+                temperature=0.0,
+                vad_filter=True,
+                condition_on_previous_text=False,
+                without_timestamps=True,
             )
-            whisper_time = time.time() - whisper_start
-            logger.debug(f"Whisper transcription completed in {whisper_time:.2f}s")
-            
-            # Safely extract text from result
-            # Only access the text field, avoid accessing segments which might cause the error
-            if isinstance(result, dict) and "text" in result:
-                text = result.get("text", "").strip()
-                logger.debug(f"Extracted text: '{text}'")
-                return text if text else None
-            logger.warning("Whisper result missing 'text' field")
-            return None
-        except ImportError:
-            logger.error("Whisper not installed")
-            print("whisper not installed. Install with: pip install openai-whisper")
-            return None
-        except Exception as e:
-            logger.error(f"Error transcribing audio: {e}", exc_info=True)
-            print(f"Error transcribing audio: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+            # Segments are generated lazily: decoding happens in the join
+            text = "".join(segment.text for segment in segments).strip()
+            logger.debug("Whisper transcription completed in %.2fs", time.perf_counter() - whisper_start)
+            logger.debug("Extracted text: '%s'", text)
+            return text if text else None
+
+        # On a CUDA tensor, whisper computes the log-mel spectrogram on the
+        # GPU too (its window and mel filters are cached per device), so
+        # only the raw samples are copied over
+        if self._whisper_device == "cuda":
+            audio_input = self._to_cuda(audio_array)
+        else:
+            audio_input = audio_array
+
+        # Use verbose=False to avoid processing segments that might cause issues
+        logger.debug("Running Whisper transcription...")
+        whisper_start = time.perf_counter()
+        result = self._whisper_model.transcribe(
+            audio_input,
+            language="en",
+            fp16=self._whisper_device == "cuda",
+            verbose=False,
+            condition_on_previous_text=False,
+            without_timestamps=True,
+        )
+        whisper_time = time.perf_counter() - whisper_start
+        logger.debug("Whisper transcription completed in %.2fs", whisper_time)
+
+        # Safely extract text from result
+        # Only access the text field, avoid accessing segments which might cause the error
+        if isinstance(result, dict) and "text" in result:
+            text = result.get("text", "").strip()
+            logger.debug("Extracted text: '%s'", text)
+            return text if text else None
+        logger.warning("Whisper result missing 'text' field")
+        return None
+
+    def _decode_batch(self, arrays: list) -> List[Optional[str]]:
+        """Decode prepared recordings in one openai-whisper call, one row each"""
+        import numpy as np
+        import torch
+        import whisper
+
+        # Padded to the 30 s window on the host, then copied as one block
+        batch = np.stack([whisper.pad_or_trim(audio_array) for audio_array in arrays])
+        if self._whisper_device == "cuda":
+            audio_input = self._to_cuda(batch.ravel()).view(batch.shape)
+        else:
+            audio_input = torch.from_numpy(batch)
+
+        # One spectrogram per row: log_mel_spectrogram normalizes against the
+        # maximum of its whole input
+        n_mels = self._whisper_model.dims.n_mels
+        mel = torch.stack([whisper.log_mel_spectrogram(row, n_mels) for row in audio_input])
+        options = whisper.DecodingOptions(
+            language="en",
+            fp16=self._whisper_device == "cuda",
+            without_timestamps=True,
+        )
+        logger.debug("Running batched Whisper decode of %d recordings...", len(arrays))
+        whisper_start = time.perf_counter()
+        results = whisper.decode(self._whisper_model, mel.to(self._whisper_model.device), options)
+        logger.debug("Whisper batch decode completed in %.2fs", time.perf_counter() - whisper_start)
+        return [result.text.strip() or None for result in results]
+
+    def _to_cuda(self, audio_array):
+        """
+        Copy samples to the GPU through a reused page-locked buffer
+
+        Pinned memory lets the copy run as an asynchronous DMA transfer on its
+        own stream instead of being staged through a pageable bounce buffer.
+        """
+        import torch
+
+        samples = audio_array.shape[0]
+        if self._pinned is None or self._pinned.shape[0] < samples:
+            # Sized for the longest single recording; grows for batches
+            size = max(samples, _MAX_RECORD_SECONDS * _RATE)
+            self._pinned = torch.empty(size, dtype=torch.float32, pin_memory=True)
+            self._copy_stream = torch.cuda.Stream()
+        staged = self._pinned[:samples]
+        staged.numpy()[:] = audio_array
+        with torch.cuda.stream(self._copy_stream):
+            audio_input = staged.to("cuda", non_blocking=True)
+        # The model runs on the default stream: make it wait for the copy
+        current = torch.cuda.current_stream()
+        current.wait_stream(self._copy_stream)
+        audio_input.record_stream(current)
+        return audio_input
+
+    @staticmethod
+    def _voiced_ratio(audio_int16) -> float:
+        """Share of 30 ms frames WebRTC VAD classifies as speech"""
+        vad = webrtcvad.Vad(_VAD_MODE)
+        pcm = audio_int16.tobytes()
+        frame_bytes = _VAD_FRAME_SAMPLES * 2
+        frames = len(pcm) // frame_bytes
+        if not frames:
+            return 0.0
+        voiced = sum(
+            vad.is_speech(pcm[start : start + frame_bytes], _RATE)
+            for start in range(0, frames * frame_bytes, frame_bytes)
+        )
+        return voiced / frames
 
     def speak(self, text: str, language: str = "en") -> None:
         """
@@ -285,18 +845,26 @@ class VoiceHandler:
         if not self.tts_enabled:
             return
 
-        logger.info(f"Speaking text: {text[:50]}...")
+        logger.info("Speaking text: %s...", text[:50])
         
-        # Run TTS in a separate thread to avoid blocking
-        tts_thread = threading.Thread(
-            target=self._speak_in_thread,
-            args=(text, language),
-            daemon=True
-        )
-        tts_thread.start()
+        # Queue for the TTS worker thread to avoid blocking; a single worker
+        # keeps consecutive sentences from overlapping
+        if self._tts_thread is None or not self._tts_thread.is_alive():
+            self._tts_thread = threading.Thread(target=self._tts_loop, daemon=True)
+            self._tts_thread.start()
+        self._tts_queue.put((text, language))
+
+    def _tts_loop(self) -> None:
+        """TTS worker loop (speaks queued text in order)"""
+        while True:
+            item = self._tts_queue.get()
+            if item is None:
+                break
+            self._speak_in_thread(*item)
+        self._close_player()
     
     def _speak_in_thread(self, text: str, language: str) -> None:
-        """Internal method to run TTS in a thread"""
+        """Internal method to run TTS in the worker thread"""
         try:
             # Try edge-tts first (more natural, local, free)
             if self._speak_edge_tts(text, language):
@@ -306,61 +874,64 @@ class VoiceHandler:
             logger.debug("Falling back to pyttsx3")
             self._speak_pyttsx3(text, language)
         except Exception as e:
-            logger.error(f"Error in TTS thread: {e}", exc_info=True)
+            logger.error("Error in TTS thread: %s", e, exc_info=True)
 
     def _speak_edge_tts(self, text: str, language: str) -> bool:
         """Use Microsoft Edge TTS (natural, local, free)"""
         try:
             import edge_tts
             import asyncio
-            import tempfile
-            import os
             import subprocess
             import platform
             
-            # Map language codes to edge-tts voices (neural voices sound natural)
-            voice_map = {
-                "es": "es-ES-ElviraNeural",      # Natural Spanish female voice
-                "en": "en-US-AriaNeural",         # Natural English female voice
-                "fr": "fr-FR-DeniseNeural",       # Natural French female voice
-            }
-            
-            voice = voice_map.get(language, voice_map["en"])
-            logger.debug(f"Using Edge TTS voice: {voice}")
+            voice = _EDGE_TTS_VOICES.get(language, _EDGE_TTS_VOICES["en"])
+            logger.debug("Using Edge TTS voice: %s", voice)
             
-            async def generate_speech():
-                communicate = edge_tts.Communicate(text, voice)
-                temp_file = os.path.join(tempfile.gettempdir(), f"apex_engineer_tts_{os.getpid()}.mp3")
-                await communicate.save(temp_file)
-                return temp_file
-            
-            # Run async function
-            temp_file = asyncio.run(generate_speech())
-            
-            # Play audio file - use playsound for cross-platform playback
-            try:
-                from playsound import playsound
-                playsound(temp_file, block=True)
-            except ImportError:
-                # Fallback to system commands
-                system = platform.system()
-                if system == "Windows":
-                    # Use PowerShell to play and wait
-                    subprocess.run(
-                        ["powershell", "-Command", f"(New-Object Media.SoundPlayer '{temp_file}').PlaySync()"],
-                        check=False,
-                        capture_output=True
-                    )
-                elif system == "Darwin":  # macOS
-                    subprocess.run(["afplay", temp_file], check=True, capture_output=True)
-                else:  # Linux
-                    subprocess.run(["mpg123", "-q", temp_file], check=True, capture_output=True)
+            # Repeated phrases are played from the cache, skipping synthesis
+            digest = hashlib.sha256(f"{voice}\n{text}".encode("utf-8")).hexdigest()
+            cached_file = _TTS_CACHE_DIR / f"{digest}.mp3"
+            if cached_file.exists():
+                logger.debug("Edge TTS cache hit")
+                os.utime(cached_file)  # Most recently used
+            elif sd is not None and miniaudio is not None:
+                # Decode and play chunks as they arrive, so playback starts
+                # with the first chunk instead of after the whole synthesis
+                self._stream_edge_tts(edge_tts, text, voice, cached_file)
+                logger.debug("Edge TTS playback completed")
+                return True
+            else:
+                _TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Written under a temporary name so a failed synthesis never
+                # leaves a truncated file in the cache
+                partial_file = cached_file.with_suffix(".part")
+                try:
+                    asyncio.run(edge_tts.Communicate(text, voice).save(str(partial_file)))
+                    os.replace(partial_file, cached_file)
+                finally:
+                    self._discard_partial(partial_file)
+                self._prune_tts_cache()
+            audio_file = str(cached_file)
             
-            # Clean up
-            try:
-                os.remove(temp_file)
-            except:
-                pass
+            # Play on the persistent output stream when available, otherwise
+            # with playsound (or a system player) per file
+            if not self._play_mp3(audio_file):
+                try:
+                    from playsound import playsound
+                    playsound(audio_file, block=True)
+                except ImportError:
+                    # Fallback to system commands
+                    system = platform.system()
+                    if system == "Windows":
+                        # Use PowerShell to play and wait
+                        subprocess.run(
+                            ["powershell", "-Command", f"(New-Object Media.SoundPlayer '{audio_file}').PlaySync()"],
+                            check=False,
+                            capture_output=True
+                        )
+                    elif system == "Darwin":  # macOS
+                        subprocess.run(["afplay", audio_file], check=True, capture_output=True)
+                    else:  # Linux
+                        subprocess.run(["mpg123", "-q", audio_file], check=True, capture_output=True)
             
             logger.debug("Edge TTS playback completed")
             return True
@@ -369,38 +940,138 @@ class VoiceHandler:
             logger.debug("edge-tts not installed, install with: pip install edge-tts")
             return False
         except Exception as e:
-            logger.warning(f"Edge TTS failed: {e}")
+            logger.warning("Edge TTS failed: %s", e)
             return False
 
+    def _stream_edge_tts(self, edge_tts, text: str, voice: str, cached_file: Path) -> None:
+        """
+        Synthesize with edge-tts and play the audio while it is still arriving
+
+        edge-tts runs on a helper thread and queues the MP3 chunks, which
+        miniaudio decodes incrementally onto the output stream. The complete
+        MP3 is then stored in the phrase cache.
+        """
+        import asyncio
+
+        chunks: queue.Queue = queue.Queue()
+        errors = []
+
+        async def produce() -> None:
+            async for chunk in edge_tts.Communicate(text, voice).stream():
+                if chunk["type"] == "audio":
+                    chunks.put(chunk["data"])
+
+        def run() -> None:
+            try:
+                asyncio.run(produce())
+            except Exception as e:
+                errors.append(e)
+            finally:
+                chunks.put(None)
+
+        threading.Thread(target=run, daemon=True).start()
+        source = _QueuedMP3(chunks)
+        player = self._ensure_player()
+        played = False
+        try:
+            for pcm in miniaudio.stream_any(
+                source,
+                source_format=miniaudio.FileFormat.MP3,
+                output_format=miniaudio.SampleFormat.SIGNED16,
+                nchannels=1,
+                sample_rate=_TTS_RATE,
+            ):
+                player.write(pcm.tobytes())
+                played = True
+        except Exception as e:
+            errors.append(e)
+        if errors:
+            # A synthesis error is recorded before the chunk queue ends, so
+            # it is reported ahead of the decode error it causes
+            if not played:
+                raise errors[0]
+            # Part of the sentence was already heard and a fallback would
+            # repeat all of it, so stop here (and cache nothing)
+            logger.warning("Edge TTS failed mid-sentence, stopping playback: %s", errors[0])
+            return
+
+        # Written under a temporary name so an interrupted write never leaves
+        # a truncated file in the cache
+        _TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        partial_file = cached_file.with_suffix(".part")
+        try:
+            partial_file.write_bytes(source.data)
+            os.replace(partial_file, cached_file)
+        finally:
+            self._discard_partial(partial_file)
+        self._prune_tts_cache()
+
+    def _ensure_player(self):
+        """Open the TTS output stream once (TTS worker thread only) and return it"""
+        if self._player is None:
+            self._player = sd.RawOutputStream(samplerate=_TTS_RATE, channels=1, dtype="int16")
+            self._player.start()
+        return self._player
+
+    def _play_mp3(self, audio_file: str) -> bool:
+        """
+        Decode an MP3 in-process and play it on the persistent output stream
+
+        Returns:
+            False if sounddevice or miniaudio is not available
+        """
+        if sd is None or miniaudio is None:
+            return False
+        decoded = miniaudio.decode_file(
+            audio_file,
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=1,
+            sample_rate=_TTS_RATE,
+        )
+        # Blocks until the samples are queued to the device
+        self._ensure_player().write(decoded.samples.tobytes())
+        return True
+
+    def _close_player(self) -> None:
+        """Close the TTS output stream"""
+        if self._player is not None:
+            try:
+                self._player.stop()
+                self._player.close()
+            except Exception as e:
+                logger.debug("Error closing TTS output stream: %s", e)
+            self._player = None
+
+    @staticmethod
+    def _discard_partial(partial_file: Path) -> None:
+        """Remove a temporary cache file left behind by a failed write"""
+        try:
+            partial_file.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug("Error removing %s: %s", partial_file, e)
+
+    @staticmethod
+    def _prune_tts_cache() -> None:
+        """Remove the least recently played phrases beyond the cache limit"""
+        try:
+            files = sorted(_TTS_CACHE_DIR.glob("*.mp3"), key=lambda path: path.stat().st_mtime, reverse=True)
+            for path in files[_TTS_CACHE_MAX_FILES:]:
+                path.unlink()
+        except OSError as e:
+            logger.debug("Error pruning TTS cache: %s", e)
+
     def _speak_pyttsx3(self, text: str, language: str) -> None:
         """Fallback to pyttsx3 with improved settings"""
         try:
-            import pyttsx3
-
-            engine = pyttsx3.init()
+            engine = self._ensure_tts_engine()
             
-            # Configure for more natural sound
-            # Set speech rate (words per minute) - slower is more natural
-            rate = engine.getProperty('rate')
-            engine.setProperty('rate', rate - 30)  # Slightly slower
-            
-            # Try to set a better voice based on language
-            voices = engine.getProperty('voices')
-            if voices:
-                # Prefer female voices (usually sound more natural)
-                for voice in voices:
-                    if language == "es" and "spanish" in voice.name.lower():
-                        engine.setProperty('voice', voice.id)
-                        break
-                    elif language == "en" and "english" in voice.name.lower():
-                        engine.setProperty('voice', voice.id)
-                        break
-                    elif language == "fr" and "french" in voice.name.lower():
-                        engine.setProperty('voice', voice.id)
-                        break
-            
-            # Set volume (0.0 to 1.0)
-            engine.setProperty('volume', 0.9)
+            # Switch to the language's voice (only when it changes)
+            voice_id = self._tts_voices.get(language)
+            if voice_id is not None and voice_id != self._tts_voice:
+                engine.setProperty('voice', voice_id)
+                self._tts_voice = voice_id
             
             logger.debug("Using pyttsx3 for TTS")
             engine.say(text)
@@ -410,6 +1081,29 @@ class VoiceHandler:
             logger.warning("pyttsx3 not installed. Install with: pip install pyttsx3")
             print("TTS not available. Install edge-tts (recommended) or pyttsx3")
         except Exception as e:
-            logger.error(f"Error with pyttsx3 TTS: {e}")
+            logger.error("Error with pyttsx3 TTS: %s", e)
             print(f"Error with TTS: {e}")
 
+    def _ensure_tts_engine(self):
+        """Create and configure the pyttsx3 engine once (TTS worker thread only)"""
+        if self._tts_engine is None:
+            import pyttsx3
+
+            engine = pyttsx3.init()
+
+            # Configure for more natural sound
+            # Set speech rate (words per minute) - slower is more natural
+            rate = engine.getProperty('rate')
+            engine.setProperty('rate', rate - 30)  # Slightly slower
+
+            # Set volume (0.0 to 1.0)
+            engine.setProperty('volume', 0.9)
+
+            # First installed voice per supported language
+            for voice in engine.getProperty('voices') or ():
+                name = voice.name.lower()
+                for lang, word in _PYTTSX3_VOICE_NAMES.items():
+                    if lang not in self._tts_voices and word in name:
+                        self._tts_voices[lang] = voice.id
+            self._tts_engine = engine
+        return self._tts_engine